@@ -0,0 +1,142 @@
+"""时间轴鼠标交互测试：空白处点击、剪辑点击、Ctrl+点击和拖动播放头"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("PyQt6.QtMultimedia", exc_type=ImportError)
+
+from PyQt6.QtCore import QPoint, Qt
+from PyQt6.QtGui import QColor, QImage
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+
+import video_editor_qt as editor
+
+NO_MODIFIER = Qt.KeyboardModifier.NoModifier
+LEFT = Qt.MouseButton.LeftButton
+
+
+class FakePreview:
+    """只记录跳转请求的时间轴模式预览"""
+
+    timeline_mode = True
+
+    def __init__(self):
+        self.seeks = []
+
+    def seek_timeline_position(self, time_seconds):
+        self.seeks.append(time_seconds)
+
+
+class FakeMainWindow:
+    """提供 MainWindow.on_playhead_position_changed 用到的属性"""
+
+    def __init__(self):
+        self.video_preview = FakePreview()
+        self.timeline = None
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def main_window(monkeypatch):
+    window = FakeMainWindow()
+    monkeypatch.setattr(editor.MainWindow, "instance", classmethod(lambda cls: window))
+    return window
+
+
+@pytest.fixture
+def preview(main_window):
+    return main_window.video_preview
+
+
+@pytest.fixture
+def timeline(app, tmp_path, main_window):
+    image = QImage(64, 48, QImage.Format.Format_RGB32)
+    image.fill(QColor(200, 100, 50))
+    image_path = tmp_path / "clip.png"
+    image.save(str(image_path))
+
+    widget = editor.TimelineWidget()
+    # 与主窗口一样，播放头位置变化时也由主窗口同步预览
+    main_window.timeline = widget
+    widget.playhead_position_changed.connect(
+        lambda time_seconds: editor.MainWindow.on_playhead_position_changed(main_window, time_seconds))
+    widget.resize(800, 300)
+    widget.show()
+    # 两个首尾相接的图片剪辑（各 5 秒），从 10 秒处开始
+    widget.add_clips_batch([editor.MediaItem(str(image_path))] * 2, 0, 10.0)
+    QApplication.processEvents()
+    yield widget
+    widget.close()
+
+
+def view_point(widget, time_seconds, y):
+    """时间轴上某一时刻、某一场景高度对应的视口坐标"""
+    return widget.mapFromScene(time_seconds * widget.pixels_per_second, y)
+
+
+def clip_point(widget, clip):
+    return widget.mapFromScene(widget.clip_graphics[clip]['rect'].sceneBoundingRect().center())
+
+
+def test_empty_click_seeks_once_and_clears_selection(timeline, preview):
+    timeline.set_selected_clips([timeline.clips[0]])
+
+    QTest.mouseClick(timeline.viewport(), LEFT, NO_MODIFIER, view_point(timeline, 40.0, 15))
+    QApplication.processEvents()
+
+    assert timeline.current_time == pytest.approx(40.0, abs=0.1)
+    assert preview.seeks == [pytest.approx(timeline.current_time)]
+    assert timeline.selected_clips == []
+
+
+def test_clip_click_selects_only_that_clip(timeline, preview):
+    first, second = timeline.clips
+    timeline.set_selected_clips([first])
+
+    QTest.mouseClick(timeline.viewport(), LEFT, NO_MODIFIER, clip_point(timeline, second))
+
+    assert timeline.selected_clips == [second]
+    assert preview.seeks == []
+
+
+def test_ctrl_click_toggles_clip_selection(timeline):
+    first, second = timeline.clips
+    ctrl = Qt.KeyboardModifier.ControlModifier
+
+    QTest.mouseClick(timeline.viewport(), LEFT, NO_MODIFIER, clip_point(timeline, first))
+    QTest.mouseClick(timeline.viewport(), LEFT, ctrl, clip_point(timeline, second))
+    assert timeline.selected_clips == [first, second]
+
+    QTest.mouseClick(timeline.viewport(), LEFT, ctrl, clip_point(timeline, first))
+    assert timeline.selected_clips == [second]
+
+
+def test_playhead_drag_throttles_preview_seeks(timeline, preview):
+    viewport = timeline.viewport()
+    start = view_point(timeline, timeline.current_time, 10)
+    moves = 40
+
+    QTest.mousePress(viewport, LEFT, NO_MODIFIER, start)
+    for i in range(1, moves + 1):
+        QTest.mouseMove(viewport, QPoint(start.x() + i * 5, start.y()))
+        QTest.qWait(5)
+    assert timeline.is_dragging_playhead()
+    QTest.mouseRelease(viewport, LEFT, NO_MODIFIER, QPoint(start.x() + moves * 5, start.y()))
+    QApplication.processEvents()
+
+    assert not timeline.is_dragging_playhead()
+    assert timeline.current_time > 0
+    # 每 80ms 最多跳转一次，松开时补上最后的位置
+    assert 0 < len(preview.seeks) < moves
+    assert preview.seeks[-1] == pytest.approx(timeline.current_time)
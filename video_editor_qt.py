@@ -20,13 +20,30 @@ EzCut - 专业桌面视频编辑器 (PyQt6版本)
 
 import sys
 import os
+import logging
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import json
+import hashlib
+import zlib
+from functools import lru_cache
+from collections import OrderedDict, deque
+import bisect
+import itertools
+import queue
+import sqlite3
 import threading
+import traceback
+import weakref
+import atexit
+import shutil
+import subprocess
+from fractions import Fraction
 import time
 from concurrent.futures import ThreadPoolExecutor
 
+logger = logging.getLogger(__name__)
+
 # PyQt6 imports
 try:
     from PyQt6.QtWidgets import (
@@ -37,17 +54,21 @@ try:
         QDialogButtonBox, QFormLayout, QLineEdit, QSpinBox, QComboBox,
         QGroupBox, QCheckBox, QTabWidget, QTextEdit, QScrollArea,
         QFrame, QSizePolicy, QGraphicsView, QGraphicsScene, QGraphicsItem,
-        QGraphicsRectItem, QGraphicsPixmapItem, QRubberBand, QHeaderView
+        QGraphicsRectItem, QGraphicsLineItem, QGraphicsTextItem, QGraphicsItemGroup,
+        QGraphicsPixmapItem, QRubberBand, QHeaderView
     )
     from PyQt6.QtCore import (
         Qt, QTimer, QThread, pyqtSignal, QObject, QRect, QPoint, QSize,
+        QPointF, QRectF, QLineF, QRunnable, QThreadPool,
         QPropertyAnimation, QEasingCurve, QAbstractAnimation, QMimeData,
-        QUrl, QFileInfo, QDir, QStandardPaths, QSettings
+        QUrl, QFileInfo, QDir, QStandardPaths, QSettings, QBuffer, QByteArray,
+        QIODevice, QSignalBlocker
     )
     from PyQt6.QtGui import (
         QPixmap, QIcon, QFont, QColor, QPalette, QPainter, QBrush, QPen,
         QLinearGradient, QAction, QKeySequence, QDragEnterEvent, QDropEvent,
-        QDrag, QCursor, QMovie, QFontDatabase, QImage, QPainterPath
+        QDrag, QCursor, QMovie, QFontDatabase, QImage, QPainterPath, QPixmapCache,
+        QPolygonF
     )
     from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
     from PyQt6.QtMultimediaWidgets import QVideoWidget
@@ -58,15 +79,30 @@ except ImportError as e:
     PYQT_AVAILABLE = False
     sys.exit(1)
 
+# NumPy for array processing
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    print("NumPy 未安装，视频处理功能将受限")
+    NUMPY_AVAILABLE = False
+
 # OpenCV for video processing
 try:
     import cv2
-    import numpy as np
     CV2_AVAILABLE = True
 except ImportError:
     print("OpenCV 未安装，视频处理功能将受限")
     CV2_AVAILABLE = False
 
+# ffmpegcv for GPU (NVDEC) decoding
+try:
+    import ffmpegcv
+    FFMPEGCV_AVAILABLE = True
+except ImportError:
+    print("ffmpegcv 未安装，将使用 OpenCV 解码缩略图")
+    FFMPEGCV_AVAILABLE = False
+
 # MoviePy for advanced video editing
 try:
     import moviepy
@@ -82,6 +118,34 @@ except ImportError:
     print("MoviePy 未安装，高级编辑功能将受限")
     MOVIEPY_AVAILABLE = False
 
+# soundfile for reading audio waveforms
+try:
+    import soundfile
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    print("soundfile 未安装，音频缩略图将不显示真实波形")
+    SOUNDFILE_AVAILABLE = False
+
+# ffprobe 只解析容器头读取元数据，不初始化解码器
+FFPROBE_PATH = shutil.which('ffprobe')
+# ffmpeg 命令行用于快速定位截取缩略图
+FFMPEG_PATH = shutil.which('ffmpeg')
+
+# Numba for JIT-compiled numeric kernels
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# PyAV for segment export
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    print("PyAV 未安装，视频片段导出功能将受限")
+    AV_AVAILABLE = False
+
 # PIL for image processing
 try:
     from PIL import Image, ImageQt
@@ -99,38 +163,450 @@ except ImportError:
     PLAYHEAD_CONTROLLER_AVAILABLE = False
     playhead_controller = None
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def peak_accumulate(block, offset, total_frames, peaks):
+        """单次遍历一块 PCM 数据 (帧数 x 声道)，把每帧的峰值 (max abs) 归约进所在区间
+        
+        offset 为该块第一帧在整个文件中的帧号，total_frames 为文件总帧数。
+        """
+        n_bins = peaks.shape[0]
+        frames, channels = block.shape
+        for i in range(frames):
+            b = min((offset + i) * n_bins // total_frames, n_bins - 1)
+            for c in range(channels):
+                value = abs(np.int32(block[i, c]))
+                if value > peaks[b]:
+                    peaks[b] = value
+else:
+    def peak_accumulate(block, offset, total_frames, peaks):
+        """把一块 PCM 数据的峰值 (max abs) 归约进所在区间，Numba 不可用时的 NumPy 实现"""
+        n_bins = peaks.shape[0]
+        magnitudes = np.abs(block.astype(np.int32)).max(axis=1)
+        bins = np.arange(offset, offset + len(block)) * n_bins // total_frames
+        np.minimum(bins, n_bins - 1, out=bins)
+        # 区间号单调不减，每段连续相同的区间号归约一次
+        starts = np.flatnonzero(np.diff(bins, prepend=-1))
+        np.maximum.at(peaks, bins[starts], np.maximum.reduceat(magnitudes, starts))
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def blend_over(canvas, frame, alpha):
+        """按 alpha (0-255) 把 frame 原地叠加到 canvas 上，单次遍历完成读取、混合和写回"""
+        h, w, channels = canvas.shape
+        inv_alpha = 255 - alpha
+        for y in prange(h):
+            for x in range(w):
+                for c in range(channels):
+                    canvas[y, x, c] = (np.int32(frame[y, x, c]) * alpha
+                                       + np.int32(canvas[y, x, c]) * inv_alpha) // 255
+    
+    # 导入时用小数组预热，避免第一次渲染时卡在编译上
+    blend_over(np.zeros((16, 16, 3), dtype=np.uint8), np.zeros((16, 16, 3), dtype=np.uint8), 128)
+else:
+    def blend_over(canvas, frame, alpha):
+        """按 alpha (0-255) 把 frame 原地叠加到 canvas 上，Numba 不可用时的 NumPy 实现"""
+        mixed = frame.astype(np.uint16) * alpha
+        mixed += canvas.astype(np.uint16) * (255 - alpha)
+        mixed //= 255
+        canvas[...] = mixed
+
+# 支持的媒体扩展名
+_VIDEO_EXT = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.m4v', '.webm'})
+_AUDIO_EXT = frozenset({'.mp3', '.wav', '.aac', '.m4a', '.flac', '.ogg'})
+_IMAGE_EXT = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff'})
+_MEDIA_EXT = _VIDEO_EXT | _AUDIO_EXT | _IMAGE_EXT
+# 扩展名 -> 媒体类型，一次字典查找代替逐个集合判断
+_EXT_MEDIA_TYPE = {
+    **{ext: 'video' for ext in _VIDEO_EXT},
+    **{ext: 'audio' for ext in _AUDIO_EXT},
+    **{ext: 'image' for ext in _IMAGE_EXT},
+}
+
+
+def _name_filter(label: str, extensions) -> str:
+    """由扩展名集合生成文件对话框过滤器，如 "视频文件 (*.avi *.mp4)" """
+    return f"{label} ({' '.join(f'*{ext}' for ext in sorted(extensions))})"
+
+# 导入媒体对话框的过滤器，与上面的扩展名集合保持一致
+_IMPORT_NAME_FILTERS = ";;".join([
+    _name_filter("媒体文件", _MEDIA_EXT),
+    _name_filter("视频文件", _VIDEO_EXT),
+    _name_filter("音频文件", _AUDIO_EXT),
+    _name_filter("图片文件", _IMAGE_EXT),
+    "所有文件 (*)",
+])
+
+
+def is_valid_media_path(path) -> bool:
+    """仅根据扩展名判断是否为支持的媒体文件，不打开文件"""
+    return Path(path).suffix.lower() in _MEDIA_EXT
+
+# 批量导入时预读的文件头长度，覆盖容器头和图片头
+_HEAD_PREFETCH_BYTES = 64 * 1024
+
+def _prefetch_file_heads(paths, length: int = _HEAD_PREFETCH_BYTES):
+    """通知内核异步预读每个文件的开头 (posix_fadvise WILLNEED)
+    
+    随后各后台任务中 ffprobe/解码器读取文件头时直接命中页缓存，
+    多个文件的磁盘读取由内核合并调度。不支持 posix_fadvise 的平台上什么也不做。
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+@lru_cache(maxsize=None)
+def _fmt_time(total_seconds: int) -> str:
+    """将整数秒格式化为 MM:SS，超过 1 小时为 HH:MM:SS（结果缓存，刻度重绘时直接复用）"""
+    minutes, seconds = divmod(total_seconds, 60)
+    if total_seconds >= 3600:
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+# 不支持的文件类型提示文本
+_SUPPORTED_FORMATS_TEXT = (
+    "支持的格式：\n"
+    "• 视频：mp4, avi, mov, mkv, wmv, flv, m4v, webm\n"
+    "• 音频：mp3, wav, aac, m4a, flac, ogg\n"
+    "• 图片：jpg, jpeg, png, bmp, gif, tiff"
+)
+_INVALID_FILE_MSG_TEMPLATE = "文件 '{name}' 不是支持的媒体文件类型。\n\n" + _SUPPORTED_FORMATS_TEXT
+_SKIPPED_FILES_MSG_TEMPLATE = "以下文件不是支持的媒体文件类型，已跳过：\n\n• {invalid_list}\n\n" + _SUPPORTED_FORMATS_TEXT
+_UNSUPPORTED_MSG_TEMPLATE = "以下文件不是支持的媒体文件类型：\n\n• {invalid_list}\n\n" + _SUPPORTED_FORMATS_TEXT
+
+# 关于对话框文本
+_ABOUT_TEXT = (
+    "EzCut - 专业视频编辑器\n\n"
+    "基于 PyQt6 开发的现代化视频编辑软件\n"
+    "支持多轨道编辑、实时预览、丰富的效果等功能\n\n"
+    "版本: 1.0.0"
+)
+
+class ThumbnailCache:
+    """缩略图磁盘缓存
+    
+    以 (文件路径, 修改时间, 文件大小, 目标尺寸) 的哈希为键，在 SQLite 中保存 PNG 数据，
+    重新导入或重启程序时无需再次解码视频帧。同一数据库的 probes 表保存视频元数据，
+    重新导入时也不必再运行 ffprobe。最近使用的缩略图另以解码后的 QImage
+    保存在内存 LRU 中，悬停预览等重复请求连 PNG 解码和数据库查询都可以省去。
+    """
+    
+    # 内存中保留的已解码缩略图数量上限
+    MEMORY_LIMIT = 256
+    # 批量预读保留的 PNG 数据条数上限，没有被取走的条目按预读顺序淘汰
+    PREFETCH_LIMIT = 256
+    # 磁盘缓存总大小上限，超出后按写入顺序淘汰最早的条目
+    MAX_BYTES = 500 * 1024 * 1024
+    # 每写入多少条检查一次总大小
+    TRIM_INTERVAL = 200
+    
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._disabled = False
+        # 批量预读的结果，后台缩略图任务读取时优先从这里取出
+        self._prefetched: "OrderedDict[str, bytes]" = OrderedDict()
+        # 已解码缩略图的内存 LRU (键 -> QImage)
+        self._images: "OrderedDict[str, QImage]" = OrderedDict()
+        self._puts_since_trim = 0
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """延迟打开数据库连接（WAL 模式，允许跨线程使用）"""
+        if self._conn is None and not self._disabled:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("CREATE TABLE IF NOT EXISTS thumbs (key TEXT PRIMARY KEY, png BLOB)")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS probes "
+                    "(key TEXT PRIMARY KEY, fps REAL, width INTEGER, height INTEGER, duration REAL)"
+                )
+                self._conn.commit()
+            except Exception as e:
+                print(f"缩略图缓存不可用 {self.db_path}: {e}")
+                self._conn = None
+                self._disabled = True
+        return self._conn
+    
+    @staticmethod
+    def make_key(file_path: Path, size: Optional[Tuple[int, int]] = None) -> Optional[str]:
+        """根据文件状态和目标尺寸生成缓存键，不给尺寸时生成元数据的键"""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        suffix = f"{size[0]}x{size[1]}" if size is not None else "probe"
+        raw = f"{file_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{suffix}"
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def encode_png(image: QImage) -> bytes:
+        """将缩略图量化为 256 色调色板后编码为 PNG 数据
+        
+        缩略图只以小尺寸显示，量化带来的损失看不出来，缓存体积约为 RGB PNG 的 1/3。
+        使用误差扩散抖动，避免渐变区域出现色带；圆角的透明度保存在调色板中。
+        """
+        image = image.convertToFormat(QImage.Format.Format_Indexed8,
+                                      Qt.ImageConversionFlag.DiffuseDither)
+        buffer = QBuffer()
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "PNG")
+        return bytes(buffer.data())
+    
+    def prefetch(self, keys: List[str], chunk_size: int = 500):
+        """批量导入时用少量 IN 查询一次读出已缓存的缩略图，代替逐个文件的单独查询
+        
+        只预读前 PREFETCH_LIMIT 个键（最先显示的行），其余行的缩略图按需单独查询。
+        """
+        keys = [key for key in keys if key][:self.PREFETCH_LIMIT]
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                for i in range(0, len(keys), chunk_size):
+                    chunk = keys[i:i + chunk_size]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, png FROM thumbs WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                    self._prefetched.update(rows)
+                while len(self._prefetched) > self.PREFETCH_LIMIT:
+                    self._prefetched.popitem(last=False)
+            except Exception as e:
+                print(f"批量读取缩略图缓存失败: {e}")
+    
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._prefetched.pop(key, None)
+            if data is not None:
+                return data
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT png FROM thumbs WHERE key=?", (key,)).fetchone()
+                return row[0] if row else None
+            except Exception as e:
+                print(f"读取缩略图缓存失败: {e}")
+                return None
+    
+    def get_image(self, key: str) -> Optional[QImage]:
+        """从内存 LRU 中取出已解码的缩略图"""
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                # 已解码的缩略图命中后不会再读取预读的 PNG 数据
+                self._prefetched.pop(key, None)
+            return image
+    
+    def put_image(self, key: str, image: QImage):
+        """把已解码的缩略图放入内存 LRU，超出上限时丢弃最久未用的"""
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.MEMORY_LIMIT:
+                self._images.popitem(last=False)
+    
+    def put(self, key: str, data: bytes):
+        if not data:
+            return
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("INSERT OR REPLACE INTO thumbs (key, png) VALUES (?, ?)", (key, data))
+                conn.commit()
+            except Exception as e:
+                print(f"写入缩略图缓存失败: {e}")
+                return
+            
+            self._puts_since_trim += 1
+            if self._puts_since_trim >= self.TRIM_INTERVAL:
+                self._puts_since_trim = 0
+                self._trim(conn)
+    
+    def get_probe(self, key: str) -> Optional[Tuple[float, int, int, float]]:
+        """读取缓存的视频元数据 (fps, 宽, 高, 时长)"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                return conn.execute(
+                    "SELECT fps, width, height, duration FROM probes WHERE key=?", (key,)
+                ).fetchone()
+            except Exception as e:
+                print(f"读取元数据缓存失败: {e}")
+                return None
+    
+    def put_probe(self, key: str, metadata: Tuple[float, int, int, float]):
+        """保存视频元数据 (fps, 宽, 高, 时长)"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("INSERT OR REPLACE INTO probes (key, fps, width, height, duration) "
+                             "VALUES (?, ?, ?, ?, ?)", (key, *metadata))
+                conn.commit()
+            except Exception as e:
+                print(f"写入元数据缓存失败: {e}")
+    
+    def _trim(self, conn: sqlite3.Connection):
+        """总大小超过 MAX_BYTES 时删除最早写入的条目（rowid 最小），直到降到上限的 90%"""
+        try:
+            total = conn.execute("SELECT COALESCE(SUM(LENGTH(png)), 0) FROM thumbs").fetchone()[0]
+            if total <= self.MAX_BYTES:
+                return
+            
+            excess = total - int(self.MAX_BYTES * 0.9)
+            doomed = []
+            for rowid, size in conn.execute("SELECT rowid, LENGTH(png) FROM thumbs ORDER BY rowid"):
+                doomed.append((rowid,))
+                excess -= size
+                if excess <= 0:
+                    break
+            conn.executemany("DELETE FROM thumbs WHERE rowid=?", doomed)
+            conn.commit()
+        except Exception as e:
+            print(f"清理缩略图缓存失败: {e}")
+
+# 全局缩略图缓存实例
+thumbnail_cache = ThumbnailCache(Path.home() / ".cache" / "ezcut" / "thumbs.sqlite")
+
+@lru_cache(maxsize=8)
+def _corner_mask(width: int, height: int, radius: int) -> QImage:
+    """生成圆角矩形的 8 位透明度遮罩，同一尺寸只绘制一次"""
+    mask = QImage(width, height, QImage.Format.Format_Alpha8)
+    mask.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(mask)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(0, 0, 0, 255))
+    painter.drawRoundedRect(QRectF(0, 0, width, height), radius, radius)
+    painter.end()
+    return mask
+
+# 音频缩略图渐变背景缓存 (尺寸 -> QImage)
+_AUDIO_BACKGROUND_CACHE: Dict[Tuple[int, int], QImage] = {}
+_AUDIO_BACKGROUND_LOCK = threading.Lock()
+
+# 没有 NVIDIA GPU / NVDEC 的机器上第一次打开 VideoCaptureNV 失败后置为 False，不再尝试
+_NVDEC_AVAILABLE = FFMPEGCV_AVAILABLE
+
+# OpenCV 4.5.2 起支持在打开时请求硬件解码；FFmpeg 后端打不开时置为 False，不再尝试
+_CV2_HW_ACCEL = CV2_AVAILABLE and hasattr(cv2, 'VIDEO_ACCELERATION_ANY')
+
+def _open_video_capture(path, hw_accel: bool = True):
+    """打开 VideoCapture，需要解码时请求硬件加速 (VideoToolbox/VAAPI/D3D11VA 等)
+    
+    平台不支持硬件解码时 FFmpeg 后端会自动使用 CPU 解码。
+    只读取元数据时传入 hw_accel=False，省去初始化硬件解码器的开销。
+    """
+    global _CV2_HW_ACCEL
+    if hw_accel and _CV2_HW_ACCEL:
+        cap = cv2.VideoCapture(str(path), cv2.CAP_FFMPEG, [
+            cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY,
+        ])
+        if cap.isOpened():
+            logger.debug("VideoCapture %s: 硬件加速类型 %s",
+                         path, int(cap.get(cv2.CAP_PROP_HW_ACCELERATION)))
+            return cap
+        cap.release()
+        _CV2_HW_ACCEL = False
+    return cv2.VideoCapture(str(path))
+
+def _metadata_property(name: str, doc: str) -> property:
+    """媒体元数据属性：第一次读取时才打开文件读取元数据，之后直接返回"""
+    attr = '_' + name
+    
+    def getter(self):
+        if not self._metadata_loaded:
+            self.ensure_metadata()
+        return getattr(self, attr)
+    
+    def setter(self, value):
+        setattr(self, attr, value)
+    
+    return property(getter, setter, doc=doc)
+
 class MediaItem:
-    """媒体项目类"""
+    """媒体项目类
     
-    def __init__(self, file_path: str):
+    构造时只根据文件名确定名称和类型；fps、尺寸、时长和文件大小在第一次读取时才加载，
+    媒体库导入时由后台缩略图任务提前读取，列表可以立即显示。
+    """
+    
+    # 缩略图取帧：从 1/4 处开始最多推进的帧数，以及每隔多少帧解码一次做亮度采样
+    THUMB_PROBE_GRABS = 30
+    THUMB_PROBE_STEP = 10
+    # 波形缩略图分块读取 PCM 的帧数，长录音不必整个读入内存
+    WAVEFORM_BLOCK_FRAMES = 65536
+    
+    fps = _metadata_property('fps', "帧率")
+    width = _metadata_property('width', "宽度")
+    height = _metadata_property('height', "高度")
+    duration = _metadata_property('duration', "时长（秒）")
+    file_size = _metadata_property('file_size', "文件大小（字节）")
+    
+    def __init__(self, file_path: str, metadata: Optional[Tuple[float, int, int, float, int]] = None):
         self.file_path = Path(file_path)
         self.name = self.file_path.name
-        self.duration = 0.0
-        self.fps = 30.0
-        self.width = 0
-        self.height = 0
-        self.file_size = 0
-        self.media_type = self._detect_media_type()
+        # 小写扩展名，分类、预览解码和属性显示都会用到，只计算一次
+        self.suffix_lower = self.file_path.suffix.lower()
+        self._duration = 0.0
+        self._fps = 30.0
+        self._width = 0
+        self._height = 0
+        self._file_size = 0
+        self._metadata_loaded = metadata is not None
+        self._metadata_lock = threading.Lock()
+        self.media_type = _EXT_MEDIA_TYPE.get(self.suffix_lower, 'unknown')
         self.thumbnail = None
-        self._load_metadata()
-    
-    def _detect_media_type(self) -> str:
-        """检测媒体类型"""
-        ext = self.file_path.suffix.lower()
-        if ext in ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.m4v', '.webm']:
-            return 'video'
-        elif ext in ['.mp3', '.wav', '.aac', '.m4a', '.flac', '.ogg']:
-            return 'audio'
-        elif ext in ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff']:
-            return 'image'
-        else:
-            return 'unknown'
+        # 缩略图任务读取元数据时打开的 VideoCapture，保留给随后的缩略图生成复用
+        self._cap = None
+        if metadata is not None:
+            # 调用方已经读取过元数据
+            self.fps, self.width, self.height, self.duration, self.file_size = metadata
+    
+    @property
+    def metadata_loaded(self) -> bool:
+        return self._metadata_loaded
+    
+    def ensure_metadata(self, keep_capture: bool = False):
+        """读取元数据（只读取一次，可在后台线程调用）
+        
+        keep_capture 为 True 时保留读取元数据打开的 VideoCapture，
+        调用方负责在生成缩略图后调用 release_capture。
+        """
+        with self._metadata_lock:
+            if not self._metadata_loaded:
+                self._load_metadata(keep_capture)
+                self._metadata_loaded = True
     
     def is_valid_media_file(self) -> bool:
         """检查是否为有效的媒体文件"""
+        # media_type 在构造时已按扩展名确定，不必再次解析
         return self.media_type != 'unknown'
     
-    def _load_metadata(self):
+    def _load_metadata(self, keep_capture: bool = False):
         """加载媒体元数据"""
         try:
             if not self.file_path.exists():
@@ -138,44 +614,129 @@ class MediaItem:
             
             self.file_size = self.file_path.stat().st_size
             
-            if self.media_type == 'video' and CV2_AVAILABLE:
-                cap = cv2.VideoCapture(str(self.file_path))
+            probe_key = None
+            if self.media_type == 'video':
+                # 文件未改变时直接使用上次读取的结果
+                probe_key = ThumbnailCache.make_key(self.file_path)
+                cached = thumbnail_cache.get_probe(probe_key) if probe_key else None
+                if cached is not None:
+                    self.fps, self.width, self.height, self.duration = cached
+                    return
+                
+                probed = _ffprobe_metadata(self.file_path)
+                if probed is not None:
+                    self.fps, self.width, self.height, self.duration = probed
+            
+            if self.media_type == 'video' and FFMPEGCV_AVAILABLE and self._duration <= 0:
+                # ffmpegcv 通过 ffprobe 读取容器信息，无需解码
+                try:
+                    cap = ffmpegcv.VideoCapture(str(self.file_path))
+                    self.fps = cap.fps
+                    self.width = cap.width
+                    self.height = cap.height
+                    frame_count = cap.count
+                    cap.release()
+                    if self._fps > 0:
+                        self.duration = frame_count / self._fps
+                except Exception as e:
+                    print(f"ffmpegcv 读取元数据失败，回退到 OpenCV {self.file_path}: {e}")
+            
+            if self.media_type == 'video' and CV2_AVAILABLE and self._duration <= 0:
+                # 保留给缩略图复用的 VideoCapture 之后要解码，才需要硬件加速
+                cap = _open_video_capture(self.file_path, hw_accel=keep_capture)
                 if cap.isOpened():
                     self.fps = cap.get(cv2.CAP_PROP_FPS)
                     self.width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
                     self.height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
                     frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-                    if self.fps > 0:
-                        self.duration = frame_count / self.fps
-                    cap.release()
+                    if self._fps > 0:
+                        self.duration = frame_count / self._fps
+                    if keep_capture:
+                        self._cap = cap  # 缩略图生成时复用，避免再次解析容器
+                    else:
+                        cap.release()
             
             elif self.media_type == 'image' and PIL_AVAILABLE:
                 with Image.open(self.file_path) as img:
                     self.width, self.height = img.size
                     self.duration = 5.0  # 默认图片显示5秒
+            
+            if probe_key and self._duration > 0:
+                thumbnail_cache.put_probe(probe_key, (self._fps, self._width, self._height, self._duration))
                     
         except Exception as e:
             print(f"加载媒体元数据失败 {self.file_path}: {e}")
     
     def generate_thumbnail(self, size: Tuple[int, int] = (120, 90)) -> Optional[QPixmap]:
-        """生成缩略图"""
+        """生成缩略图（须在主线程调用）"""
+        image = self.generate_thumbnail_image(size)
+        self.thumbnail = QPixmap.fromImage(image) if image is not None else None
+        return self.thumbnail
+    
+    def generate_thumbnail_image(self, size: Tuple[int, int] = (120, 90)) -> Optional[QImage]:
+        """生成缩略图图像，视频和图片优先读取磁盘缓存
+        
+        只使用 QImage，可以在后台线程中调用。
+        """
+        cache_key = None
+        if self.media_type in ('video', 'image'):
+            cache_key = thumbnail_cache.make_key(self.file_path, size)
+        
+        if cache_key:
+            image = thumbnail_cache.get_image(cache_key)
+            if image is not None:
+                self.release_capture()
+                return image
+            
+            data = thumbnail_cache.get(cache_key)
+            if data:
+                image = QImage()
+                if image.loadFromData(data, "PNG"):
+                    self.release_capture()
+                    thumbnail_cache.put_image(cache_key, image)
+                    return image
+        
+        image = self._render_thumbnail(size)
+        if cache_key and image is not None:
+            thumbnail_cache.put_image(cache_key, image)
+            thumbnail_cache.put(cache_key, ThumbnailCache.encode_png(image))
+        return image
+    
+    def _render_thumbnail(self, size: Tuple[int, int]) -> Optional[QImage]:
+        """解码媒体文件生成缩略图"""
+        thumbnail = None
         try:
+            if self.media_type == 'video' and _NVDEC_AVAILABLE:
+                thumbnail = self._generate_video_thumbnail_nv(size)
+                if thumbnail is not None:
+                    self.release_capture()
+                    return thumbnail
+            
+            if self.media_type == 'video' and FFMPEG_PATH is not None:
+                thumbnail = self._generate_video_thumbnail_ffmpeg(size)
+                if thumbnail is not None:
+                    self.release_capture()
+                    return thumbnail
+            
             if self.media_type == 'video' and CV2_AVAILABLE:
-                cap = cv2.VideoCapture(str(self.file_path))
+                cap = self._take_capture()
                 if cap.isOpened():
                     # 尝试获取多个帧，选择最佳的一帧
                     frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
                     best_frame = None
                     
-                    # 尝试获取几个不同位置的帧
-                    positions = [frame_count // 4, frame_count // 2, frame_count * 3 // 4]
-                    
-                    for pos in positions:
-                        cap.set(cv2.CAP_PROP_POS_FRAMES, pos)
-                        ret, frame = cap.read()
+                    # 从 1/4 处开始只用 grab() 推进码流，每隔几帧才 retrieve() 解码一帧采样
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_count // 4)
+                    for i in range(self.THUMB_PROBE_GRABS):
+                        if not cap.grab():
+                            break
+                        if i % self.THUMB_PROBE_STEP:
+                            continue
+                        ret, frame = cap.retrieve()
                         if ret:
                             # 检查帧是否不是纯黑色（避免黑屏）
-                            if cv2.mean(frame)[0] > 10:  # 平均亮度大于10
+                            # 隔 8 像素采样估计平均亮度，大于10即可
+                            if frame[::8, ::8].mean() > 10:
                                 best_frame = frame
                                 break
                     
@@ -185,29 +746,27 @@ class MediaItem:
                         ret, best_frame = cap.read()
                     
                     if best_frame is not None:
-                        # 转换颜色空间
-                        frame_rgb = cv2.cvtColor(best_frame, cv2.COLOR_BGR2RGB)
-                        h, w, ch = frame_rgb.shape
-                        bytes_per_line = ch * w
-                        
-                        # 创建QImage
-                        qt_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+                        # 先按比例缩小再转换颜色空间，颜色转换只处理缩略图大小的像素
+                        h, w = best_frame.shape[:2]
+                        scale = min(size[0] / w, size[1] / h)
+                        target_size = (max(1, round(w * scale)), max(1, round(h * scale)))
+                        small = cv2.resize(best_frame, target_size, interpolation=cv2.INTER_AREA)
+                        frame_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
                         
-                        # 转换为QPixmap并缩放
-                        pixmap = QPixmap.fromImage(qt_image)
-                        self.thumbnail = pixmap.scaled(
-                            size[0], size[1], 
-                            Qt.AspectRatioMode.KeepAspectRatio, 
-                            Qt.TransformationMode.SmoothTransformation
-                        )
+                        # QImage 只是借用 numpy 缓冲区，在 frame_rgb 释放前复制出独立的图像
+                        tw, th = target_size
+                        qt_image = QImage(frame_rgb.data, tw, th, 3 * tw, QImage.Format.Format_RGB888).copy()
                         
                         # 添加圆角效果
-                        self.thumbnail = self._add_rounded_corners(self.thumbnail)
+                        thumbnail = self._add_rounded_corners(qt_image)
                     
                     cap.release()
             
             elif self.media_type == 'image' and PIL_AVAILABLE:
                 with Image.open(self.file_path) as img:
+                    # JPEG 在解码阶段直接缩小 (draft 模式)，其他格式无影响
+                    img.draft('RGB', (size[0] * 2, size[1] * 2))
+                    
                     # 转换为RGB模式（处理RGBA等格式）
                     if img.mode != 'RGB':
                         img = img.convert('RGB')
@@ -225,87 +784,241 @@ class MediaItem:
                         new_height = size[1]
                         new_width = int(size[1] * img_ratio)
                     
-                    # 高质量缩放
-                    img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                    # 列表小图（不超过 128 像素）用 BILINEAR，肉眼看不出区别且快得多；
+                    # 预览等大图仍用 LANCZOS 高质量缩放
+                    if max(size) <= 128:
+                        resample = Image.Resampling.BILINEAR
+                    else:
+                        resample = Image.Resampling.LANCZOS
+                    img_resized = img.resize((new_width, new_height), resample)
                     
-                    # 转换为QPixmap
+                    # 转换为QImage并添加圆角效果
                     qt_image = ImageQt.ImageQt(img_resized)
-                    self.thumbnail = QPixmap.fromImage(qt_image)
-                    
-                    # 添加圆角效果
-                    self.thumbnail = self._add_rounded_corners(self.thumbnail)
+                    thumbnail = self._add_rounded_corners(qt_image)
             
             elif self.media_type == 'audio':
                 # 为音频文件创建美观的默认图标
-                self.thumbnail = self._create_audio_thumbnail(size)
+                thumbnail = self._create_audio_thumbnail(size)
             
-            return self.thumbnail
+            return thumbnail
             
         except Exception as e:
             print(f"生成缩略图失败 {self.file_path}: {e}")
             return None
     
-    def _add_rounded_corners(self, pixmap: QPixmap, radius: int = 8) -> QPixmap:
-        """为缩略图添加圆角效果"""
+    def _take_capture(self):
+        """取出元数据阶段保留的 VideoCapture，没有则重新打开"""
+        cap, self._cap = self._cap, None
+        if cap is None:
+            cap = _open_video_capture(self.file_path)
+        return cap
+    
+    def release_capture(self):
+        """释放保留的 VideoCapture"""
+        cap, self._cap = self._cap, None
+        if cap is not None:
+            cap.release()
+    
+    def _generate_video_thumbnail_nv(self, size: Tuple[int, int]) -> Optional[QImage]:
+        """使用 NVDEC 解码并在 GPU 上缩放生成视频缩略图，失败时返回 None"""
+        global _NVDEC_AVAILABLE
+        cap = None
         try:
-            rounded = QPixmap(pixmap.size())
-            rounded.fill(Qt.GlobalColor.transparent)
-            
-            painter = QPainter(rounded)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            
-            # 创建圆角矩形路径
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, pixmap.width(), pixmap.height(), radius, radius)
+            try:
+                cap = ffmpegcv.VideoCaptureNV(str(self.file_path), pix_fmt='rgb24', resize=size)
+            except Exception as e:
+                _NVDEC_AVAILABLE = False
+                print(f"NVDEC 不可用，之后的缩略图直接使用 CPU 解码: {e}")
+                return None
+            for i in range(self.THUMB_PROBE_GRABS):
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                if i % self.THUMB_PROBE_STEP or frame[::8, ::8].mean() <= 10:
+                    continue
+                
+                # 解码结果已经是缩放后的 RGB 数据，无需 cvtColor 和 QImage.scaled
+                h, w, ch = frame.shape
+                qt_image = QImage(frame.data, w, h, ch * w, QImage.Format.Format_RGB888)
+                return self._add_rounded_corners(qt_image)
+        except Exception as e:
+            print(f"NVDEC 缩略图生成失败，回退到 OpenCV {self.file_path}: {e}")
+        finally:
+            if cap is not None:
+                cap.release()
+        return None
+    
+    def _generate_video_thumbnail_ffmpeg(self, size: Tuple[int, int]) -> Optional[QImage]:
+        """用 ffmpeg 截取缩略图，失败时返回 None
+        
+        -ss 放在 -i 之前，ffmpeg 按容器索引直接跳到附近的关键帧，而不是从头解码；
+        缩放也在 ffmpeg 内完成，输出的 JPEG 直接交给 QImage 解码。
+        先取 1/4 处，画面过暗时再取中间位置。
+        """
+        for position in (0.25, 0.5):
+            try:
+                result = subprocess.run(
+                    [FFMPEG_PATH, '-v', 'quiet', '-ss', f"{self.duration * position:.3f}",
+                     '-i', str(self.file_path), '-frames:v', '1',
+                     '-vf', f"scale={size[0]}:{size[1]}:force_original_aspect_ratio=decrease",
+                     '-f', 'image2pipe', '-vcodec', 'mjpeg', '-'],
+                    capture_output=True, timeout=5
+                )
+            except (OSError, subprocess.SubprocessError) as e:
+                print(f"ffmpeg 缩略图生成失败，回退到 OpenCV {self.file_path}: {e}")
+                return None
             
-            painter.setClipPath(path)
-            painter.drawPixmap(0, 0, pixmap)
-            painter.end()
+            image = QImage()
+            if result.returncode != 0 or not image.loadFromData(result.stdout, "JPEG"):
+                return None
             
+            # 转为灰度估计平均亮度，大于10即可
+            gray = image.convertToFormat(QImage.Format.Format_Grayscale8)
+            luma = np.frombuffer(gray.constBits().asstring(gray.sizeInBytes()), dtype=np.uint8)
+            if luma.mean() > 10 or position == 0.5:
+                return self._add_rounded_corners(image)
+        return None
+    
+    def _add_rounded_corners(self, image: QImage, radius: int = 8) -> QImage:
+        """为缩略图添加圆角效果"""
+        try:
+            # 直接写入预先绘制好的圆角遮罩作为透明通道
+            rounded = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+            rounded.setAlphaChannel(_corner_mask(image.width(), image.height(), radius))
             return rounded
         except:
-            return pixmap  # 如果失败，返回原图
+            return image  # 如果失败，返回原图
     
-    def _create_audio_thumbnail(self, size: Tuple[int, int]) -> QPixmap:
-        """创建音频文件的美观缩略图"""
-        pixmap = QPixmap(size[0], size[1])
+    def _load_waveform_peaks(self, n_bins: int) -> Optional["np.ndarray"]:
+        """分块读取音频 PCM 数据并归约为 n_bins 个归一化峰值，无法读取时返回 None"""
+        if not SOUNDFILE_AVAILABLE:
+            return None
+        try:
+            peaks = np.zeros(n_bins, dtype=np.float32)
+            with soundfile.SoundFile(str(self.file_path)) as sound_file:
+                total_frames = sound_file.frames
+                if total_frames <= 0:
+                    return None
+                offset = 0
+                for block in sound_file.blocks(blocksize=self.WAVEFORM_BLOCK_FRAMES,
+                                               dtype='int16', always_2d=True):
+                    # 同一区间内取所有声道的峰值
+                    peak_accumulate(block, offset, total_frames, peaks)
+                    offset += len(block)
+            if offset == 0:
+                return None
+            max_peak = peaks.max()
+            return peaks / max_peak if max_peak > 0 else peaks
+        except Exception as e:
+            print(f"读取音频波形失败 {self.file_path}: {e}")
+            return None
+    
+    @staticmethod
+    def _audio_background(size: Tuple[int, int]) -> QImage:
+        """获取音频缩略图的渐变背景，同一尺寸只绘制一次
         
-        # 创建渐变背景
-        gradient = QLinearGradient(0, 0, size[0], size[1])
-        gradient.setColorAt(0, QColor(76, 175, 80))  # 绿色
-        gradient.setColorAt(1, QColor(139, 195, 74))  # 浅绿色
+        缩略图在后台线程生成，QPixmapCache 只能在主线程使用，因此用加锁的 QImage 字典缓存。
+        """
+        with _AUDIO_BACKGROUND_LOCK:
+            background = _AUDIO_BACKGROUND_CACHE.get(size)
+            if background is None:
+                background = QImage(size[0], size[1], QImage.Format.Format_ARGB32_Premultiplied)
+                
+                # 创建渐变背景
+                gradient = QLinearGradient(0, 0, size[0], size[1])
+                gradient.setColorAt(0, QColor(76, 175, 80))  # 绿色
+                gradient.setColorAt(1, QColor(139, 195, 74))  # 浅绿色
+                
+                painter = QPainter(background)
+                painter.fillRect(background.rect(), QBrush(gradient))
+                painter.end()
+                _AUDIO_BACKGROUND_CACHE[size] = background
+            return background
+    
+    def _create_audio_thumbnail(self, size: Tuple[int, int]) -> QImage:
+        """创建音频文件的美观缩略图"""
+        # 复制缓存的背景，在副本上绘制当前文件的波形
+        image = self._audio_background(tuple(size)).copy()
         
-        painter = QPainter(pixmap)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.fillRect(pixmap.rect(), QBrush(gradient))
         
         # 绘制音频波形图案
         painter.setPen(QPen(QColor(255, 255, 255, 180), 2))
         
-        # 绘制简化的音频波形
-        import random
-        random.seed(hash(str(self.file_path)))  # 基于文件路径生成固定的随机数
-        
         wave_width = size[0] - 20
         wave_height = size[1] - 40
         start_x = 10
         start_y = size[1] // 2
         
-        for i in range(0, wave_width, 4):
-            height = random.randint(5, wave_height // 2)
-            painter.drawLine(start_x + i, start_y - height, start_x + i, start_y + height)
+        # 每 4 像素一根竖线，优先使用真实波形的峰值作为高度
+        bar_count = max(1, (wave_width + 3) // 4)
+        peaks = self._load_waveform_peaks(bar_count)
+        if peaks is not None:
+            heights = np.maximum(1, (peaks * (wave_height // 2)).astype(np.int32))
+        else:
+            # 绘制简化的音频波形，基于文件路径生成固定的随机高度
+            # (用 crc32 而不是 hash()，后者每次启动加盐，重启后波形会变)
+            rng = np.random.default_rng(zlib.crc32(str(self.file_path).encode('utf-8')))
+            heights = rng.integers(5, wave_height // 2, size=bar_count, endpoint=True)
+        
+        # 一次性批量绘制所有竖线
+        lines = [
+            QLineF(start_x + i * 4, start_y - height, start_x + i * 4, start_y + height)
+            for i, height in enumerate(heights.tolist())
+        ]
+        painter.drawLines(lines)
         
         # 绘制音符图标
         painter.setPen(QPen(QColor(255, 255, 255), 3))
         painter.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "♪")
+        painter.drawText(image.rect(), Qt.AlignmentFlag.AlignCenter, "♪")
         
         painter.end()
-        return pixmap
+        return image
+
+def _parse_frame_rate(rate: str) -> float:
+    """解析 ffprobe 的帧率字符串，如 "30000/1001" 或 "25" """
+    numerator, _, denominator = rate.partition('/')
+    try:
+        if denominator:
+            return float(numerator) / float(denominator) if float(denominator) else 0.0
+        return float(numerator)
+    except ValueError:
+        return 0.0
+
+def _ffprobe_metadata(file_path) -> Optional[Tuple[float, int, int, float]]:
+    """用 ffprobe 读取视频元数据，返回 (fps, 宽, 高, 时长)；ffprobe 不可用或失败时返回 None"""
+    if FFPROBE_PATH is None:
+        return None
+    try:
+        result = subprocess.run(
+            [FFPROBE_PATH, '-v', 'quiet', '-print_format', 'json',
+             '-select_streams', 'v:0', '-show_streams', '-show_format', str(file_path)],
+            capture_output=True, timeout=2
+        )
+        if result.returncode != 0:
+            return None
+        info = json.loads(result.stdout)
+        streams = info.get('streams') or []
+        if not streams:
+            return None
+        stream = streams[0]
+        fps = _parse_frame_rate(stream.get('avg_frame_rate') or '0')
+        if fps <= 0:
+            fps = _parse_frame_rate(stream.get('r_frame_rate') or '0')
+        duration = float(info.get('format', {}).get('duration') or stream.get('duration') or 0.0)
+        return fps, int(stream.get('width', 0)), int(stream.get('height', 0)), duration
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
+        print(f"ffprobe 读取元数据失败 {file_path}: {e}")
+        return None
 
 class TimelineClip:
     """时间轴剪辑片段"""
     
+    # 任一剪辑的位置或长度改变时递增，缓存了剪辑区间的索引据此判断是否需要重建
+    edit_epoch = 0
+    
     def __init__(self, media_item: MediaItem, track: int, start_time: float, duration: float):
         self.media_item = media_item
         self.track = track
@@ -313,6 +1026,7 @@ class TimelineClip:
         self.duration = duration
         self.in_point = 0.0  # 媒体文件内的起始点
         self.out_point = duration  # 媒体文件内的结束点
+        self.opacity = 1.0  # 合成时的不透明度 (0.0-1.0)
         self.selected = False
         self.locked = False
         
@@ -323,12 +1037,242 @@ class TimelineClip:
     def move_to(self, new_start_time: float):
         """移动剪辑到新位置"""
         self.start_time = new_start_time
+        TimelineClip.edit_epoch += 1
     
     def resize(self, new_duration: float):
         """调整剪辑长度"""
         if new_duration > 0:
             self.duration = new_duration
             self.out_point = self.in_point + new_duration
+            TimelineClip.edit_epoch += 1
+
+class ClipIntervalIndex:
+    """剪辑时间区间索引
+    
+    剪辑按开始时间排序，max_ends[i] 为前 i+1 个剪辑结束时间的最大值。
+    查询某一时刻时先二分定位最后一个已开始的剪辑，再向前回溯，
+    直到 max_ends 早于该时刻为止，通常只需检查少量剪辑。
+    """
+    
+    def __init__(self, clips: List[TimelineClip]):
+        self.clips = sorted(clips, key=lambda clip: clip.start_time)
+        self.starts = [clip.start_time for clip in self.clips]
+        self.max_ends = list(itertools.accumulate((clip.end_time for clip in self.clips), max))
+    
+    def clips_at(self, time_seconds: float) -> List[TimelineClip]:
+        """返回覆盖该时刻（含首尾）的所有剪辑，按开始时间排序"""
+        i = bisect.bisect_right(self.starts, time_seconds) - 1
+        result = []
+        while i >= 0 and self.max_ends[i] >= time_seconds:
+            clip = self.clips[i]
+            if clip.end_time >= time_seconds:
+                result.append(clip)
+            i -= 1
+        result.reverse()
+        return result
+
+class SegmentExporter:
+    """视频片段导出流水线
+    
+    解码线程负责解复用和解码源文件，编码线程负责缩放和编码输出，
+    两者通过有界队列解耦，较快的一侧会被队列自动限速。
+    """
+    
+    QUEUE_SIZE = 8
+    
+    def __init__(self, clips: List[TimelineClip], start_time: float, end_time: float,
+                 output_path: str, resolution: Tuple[int, int], fps: float = 30.0):
+        # 只导出与片段区间重叠的视频剪辑，按时间轴顺序解码
+        self.clips = sorted(
+            (clip for clip in clips
+             if clip.media_item.media_type == 'video'
+             and clip.end_time > start_time and clip.start_time < end_time),
+            key=lambda clip: (clip.start_time, clip.track)
+        )
+        self.start_time = start_time
+        self.end_time = end_time
+        self.output_path = output_path
+        # yuv420p 要求宽高为偶数
+        self.resolution = (resolution[0] // 2 * 2, resolution[1] // 2 * 2)
+        self.fps = int(round(fps)) or 30
+        self.frame_queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.error: Optional[str] = None
+        self.frames_written = 0
+        self._cancelled = threading.Event()
+        self._threads: List[threading.Thread] = []
+    
+    def start(self):
+        """启动解码和编码线程"""
+        self._threads = [
+            threading.Thread(target=self._demux_worker, name="ezcut-export-demux", daemon=True),
+            threading.Thread(target=self._encode_worker, name="ezcut-export-encode", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def is_running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+    
+    def cancel(self):
+        self._cancelled.set()
+    
+    def _put(self, item) -> bool:
+        """向队列放入数据，队列满时等待，导出取消时返回 False"""
+        while not self._cancelled.is_set():
+            try:
+                self.frame_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _demux_worker(self):
+        """解码线程：解复用 + 解码源帧并送入队列"""
+        try:
+            for clip in self.clips:
+                if not self._decode_clip(clip):
+                    break
+        except Exception as e:
+            self.error = f"解码失败: {e}"
+            self._cancelled.set()
+        finally:
+            self._put(None)
+    
+    def _decode_clip(self, clip: TimelineClip) -> bool:
+        """解码单个剪辑在导出区间内的帧"""
+        segment_start = max(clip.start_time, self.start_time)
+        segment_end = min(clip.end_time, self.end_time)
+        source_start = clip.in_point + (segment_start - clip.start_time)
+        source_end = clip.in_point + (segment_end - clip.start_time)
+        
+        with av.open(str(clip.media_item.file_path)) as container:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            if source_start > 0 and stream.time_base:
+                container.seek(int(source_start / stream.time_base), stream=stream)
+            
+            for packet in container.demux(stream):
+                for frame in packet.decode():
+                    if frame.time is None or frame.time < source_start:
+                        continue
+                    if frame.time >= source_end:
+                        return True
+                    output_time = clip.start_time + (frame.time - clip.in_point) - self.start_time
+                    if not self._put((output_time, frame)):
+                        return False
+        return True
+    
+    def _encode_worker(self):
+        """编码线程：从队列取帧，缩放后送入编码器并写入输出文件"""
+        output = None
+        try:
+            output = av.open(self.output_path, mode="w")
+            codec = "mpeg4" if self.output_path.lower().endswith(".avi") else "h264"
+            stream = output.add_stream(codec, rate=self.fps)
+            stream.width, stream.height = self.resolution
+            stream.pix_fmt = "yuv420p"
+            
+            time_base = Fraction(1, self.fps)
+            last_pts = -1
+            while True:
+                try:
+                    item = self.frame_queue.get(timeout=0.1)
+                except queue.Empty:
+                    # 解码线程出错或导出被取消时不会再送来结束标记
+                    if self._cancelled.is_set():
+                        break
+                    continue
+                if item is None:
+                    break
+                output_time, frame = item
+                pts = int(round(output_time * self.fps))
+                if pts <= last_pts:
+                    continue  # 源帧率高于输出帧率时丢弃重复帧
+                last_pts = pts
+                
+                output_frame = frame.reformat(width=self.resolution[0], height=self.resolution[1],
+                                              format="yuv420p")
+                output_frame.pts = pts
+                output_frame.time_base = time_base
+                for packet in stream.encode(output_frame):
+                    output.mux(packet)
+                self.frames_written += 1
+            
+            # 刷新编码器缓冲
+            for packet in stream.encode():
+                output.mux(packet)
+        except Exception as e:
+            self.error = f"编码失败: {e}"
+            self._cancelled.set()
+        finally:
+            if output is not None:
+                output.close()
+
+class TimelineCut:
+    """符号化的剪切操作：引用源文件中的一段，在真正需要像素之前不做任何解码"""
+    
+    __slots__ = ('clip',)
+    
+    def __init__(self, clip: TimelineClip):
+        self.clip = clip
+    
+    def covers(self, time_seconds: float) -> bool:
+        return self.clip.start_time <= time_seconds < self.clip.end_time
+    
+    def source_time(self, time_seconds: float) -> float:
+        """时间轴时间对应的源文件时间"""
+        return time_seconds - self.clip.start_time + self.clip.in_point
+
+class TimelineSpec:
+    """时间轴合成的符号化描述
+    
+    时间轴由若干 TimelineCut 拼接而成，编辑时只更新描述，
+    渲染某一时刻时才定位覆盖该时刻的剪切并解码对应的源帧。
+    剪切通过 ClipIntervalIndex 按时间定位。描述引用时间轴的剪辑列表本身而不是副本，
+    剪辑被增删、移动或调整长度后下次查询时重建剪切和索引。
+    """
+    
+    def __init__(self, clips: Optional[List[TimelineClip]] = None):
+        self.clips = clips if clips is not None else []
+        self.cuts: List[TimelineCut] = []
+        self._cut_by_clip: Dict[int, Tuple[TimelineCut, int]] = {}
+        self._index: Optional[ClipIntervalIndex] = None
+        self._index_epoch = -1
+        self._index_count = -1
+    
+    def _sync(self):
+        """剪辑列表或剪辑位置变化后重建剪切列表和区间索引"""
+        if (self._index is not None and self._index_epoch == TimelineClip.edit_epoch
+                and self._index_count == len(self.clips)):
+            return
+        self.cuts = [TimelineCut(clip) for clip in self.clips]
+        # 剪辑 -> (剪切, 在列表中的位置)，同一轨道内保持原有的叠放顺序
+        self._cut_by_clip = {id(cut.clip): (cut, i) for i, cut in enumerate(self.cuts)}
+        self._index = ClipIntervalIndex(self.clips)
+        self._index_epoch = TimelineClip.edit_epoch
+        self._index_count = len(self.clips)
+    
+    def cuts_at(self, time_seconds: float) -> List[TimelineCut]:
+        """获取覆盖指定时间的剪切，按轨道排序（轨道号越大越在上层）"""
+        self._sync()
+        
+        entries = [self._cut_by_clip[id(clip)] for clip in self._index.clips_at(time_seconds)]
+        # 索引包含结束时刻，这里按 [开始, 结束) 过滤
+        entries = [entry for entry in entries if entry[0].covers(time_seconds)]
+        entries.sort(key=lambda entry: (entry[0].clip.track, entry[1]))
+        return [cut for cut, _ in entries]
+
+# 所有 TimelineRenderer 共享的渲染线程池，按 CPU 核数设置上限
+_RENDER_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 2),
+                                  thread_name_prefix='ezcut-render')
+atexit.register(_RENDER_POOL.shutdown, wait=False, cancel_futures=True)
+
+# 多轨合成时并行解码各层的线程池；渲染任务在 _RENDER_POOL 中等待它，
+# 因此必须是独立的池，避免互相等待而死锁。单核机器上不启用
+_DECODE_POOL = (ThreadPoolExecutor(max_workers=min(4, os.cpu_count()), thread_name_prefix='ezcut-decode')
+                if (os.cpu_count() or 1) > 1 else None)
+if _DECODE_POOL is not None:
+    atexit.register(_DECODE_POOL.shutdown, wait=False, cancel_futures=True)
 
 class TimelineRenderer(QObject):
     """时间轴实时渲染引擎"""
@@ -336,29 +1280,58 @@ class TimelineRenderer(QObject):
     # 信号定义
     frameReady = pyqtSignal(QPixmap)  # 渲染完成的帧
     renderError = pyqtSignal(str)     # 渲染错误
+    _renderDone = pyqtSignal(object, object)  # 工作线程完成渲染 (future, 缓存键)，排队回到主线程
+    
+    # 保持打开的 PyAV 容器数量上限
+    AV_READER_CACHE_SIZE = 8
+    # 向前拖动时，目标帧与上次位置相差不超过该帧数则顺序解码而不重新定位
+    SEQUENTIAL_GRAB_LIMIT = 30
     
     def __init__(self):
         super().__init__()
         self.clips: List[TimelineClip] = []
+        self.spec = TimelineSpec()
         self.current_time = 0.0
         self.fps = 30.0
         self.resolution = (1280, 720)  # 降低默认分辨率，提高性能
         self.is_rendering = False
+        self._pending_time: Optional[float] = None  # 渲染进行中时收到的最新请求
         self.auto_resolution = True  # 自动调整分辨率
         
         # 渲染缓存
-        self.frame_cache = {}
+        # 以合成内容为键的帧缓存 (LRU)，见 _frame_key
+        self.frame_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
         self.cache_size_limit = 100  # 最多缓存100帧
         
         # 线程池用于异步渲染
-        self.thread_pool = ThreadPoolExecutor(max_workers=2)
+        self.thread_pool = _RENDER_POOL
+        self._renderDone.connect(self._on_frame_done, Qt.ConnectionType.QueuedConnection)
         
         # OpenCV相关
         self.cv2_available = CV2_AVAILABLE
         
+        # PyAV 解码：按文件路径缓存打开的容器，避免每帧重新打开文件和解析索引
+        self.use_pyav = AV_AVAILABLE
+        self._av_readers: "OrderedDict[str, list]" = OrderedDict()
+        self._av_readers_lock = threading.Lock()
+        
+        # OpenCV 回退路径：按路径缓存 (VideoCapture, 上次读取的帧号)
+        self._cap_cache: Dict[str, Tuple[object, int]] = {}
+        self._cap_cache_lock = threading.Lock()
+        
+        # 每个渲染线程一块输出尺寸的缩放缓冲区，避免每帧重新分配
+        self._scratch = threading.local()
+        
+        # 合成画布环：工作线程返回直接引用画布的 QImage，主线程转换成 QPixmap 之前
+        # 下一帧写入环中的另一块画布，不会覆盖尚未转换的像素
+        self._canvas_ring: List[np.ndarray] = []
+        self._ring_idx = 0
+        self._ring_lock = threading.Lock()
+        
     def set_clips(self, clips: List[TimelineClip]):
         """设置时间轴剪辑列表"""
         self.clips = clips
+        self.spec = TimelineSpec(clips)
         self.clear_cache()
         
     def set_resolution(self, width: int, height: int):
@@ -367,118 +1340,198 @@ class TimelineRenderer(QObject):
         self.clear_cache()
         
     def clear_cache(self):
-        """清空帧缓存"""
+        """清空帧缓存并释放 OpenCV 解码器"""
         self.frame_cache.clear()
+        self._release_captures()
+    
+    def _release_captures(self):
+        """释放缓存的 VideoCapture"""
+        with self._cap_cache_lock:
+            for cap, _ in self._cap_cache.values():
+                cap.release()
+            self._cap_cache.clear()
+    
+    def __del__(self):
+        try:
+            self._release_captures()
+            self.close_readers()
+        except Exception:
+            pass
         
     def render_frame_at_time(self, time_seconds: float):
-        """渲染指定时间点的帧"""
+        """渲染指定时间点的帧
+        
+        已有渲染进行中时只记下最新的请求时间，完成后渲染最新的那一个，中间的请求直接丢弃。
+        """
         if self.is_rendering:
+            self._pending_time = time_seconds
             return
             
         self.current_time = time_seconds
         
         # 检查缓存
-        cache_key = f"{time_seconds:.3f}"
-        if cache_key in self.frame_cache:
-            self.frameReady.emit(self.frame_cache[cache_key])
+        cuts = self.spec.cuts_at(time_seconds)
+        cache_key = self._frame_key(cuts, time_seconds, self.resolution)
+        pixmap = self.frame_cache.get(cache_key)
+        if pixmap is not None:
+            self.frame_cache.move_to_end(cache_key)
+            self.frameReady.emit(pixmap)
             return
             
         # 异步渲染
         self.is_rendering = True
-        future = self.thread_pool.submit(self._render_frame_sync, time_seconds)
+        future = self.thread_pool.submit(self._render_cuts, cuts, time_seconds)
         
-        # 使用QTimer来检查渲染结果
-        self._check_render_result(future, cache_key)
+        # 完成回调在工作线程中执行，通过排队信号把结果交回主线程处理
+        future.add_done_callback(lambda done: self._renderDone.emit(done, cache_key))
         
-    def _check_render_result(self, future, cache_key):
-        """检查渲染结果"""
-        def check():
-            if future.done():
-                try:
-                    pixmap = future.result()
-                    if pixmap:
-                        # 添加到缓存
-                        if len(self.frame_cache) >= self.cache_size_limit:
-                            # 移除最旧的缓存项
-                            oldest_key = next(iter(self.frame_cache))
-                            del self.frame_cache[oldest_key]
-                        
-                        self.frame_cache[cache_key] = pixmap
-                        self.frameReady.emit(pixmap)
-                    else:
-                        self.renderError.emit("渲染失败")
-                except Exception as e:
-                    self.renderError.emit(f"渲染错误: {str(e)}")
-                finally:
-                    self.is_rendering = False
-            else:
-                # 继续检查
-                QTimer.singleShot(10, check)
-                
-        check()
+    @staticmethod
+    def _frame_key(cuts: List[TimelineCut], time_seconds: float, resolution: Tuple[int, int]) -> tuple:
+        """按输出分辨率和合成内容生成缓存键：分辨率之后是每个剪切的源文件、源帧号、轨道和不透明度
         
-    def _render_frame_sync(self, time_seconds: float) -> Optional[QPixmap]:
-        """同步渲染帧（在线程中执行）"""
+        剪辑被移动或修剪后键随之改变，不会取到过期的帧；播放头在同一源帧内移动时命中同一缓存。
+        图片与时间无关，源帧号固定为 0。
+        """
+        key = [resolution]
+        for cut in cuts:
+            media_item = cut.clip.media_item
+            if media_item.media_type == 'video':
+                source_frame = int(cut.source_time(time_seconds) * (media_item.fps or 30))
+            else:
+                source_frame = 0
+            key.append((str(media_item.file_path), source_frame, cut.clip.track, cut.clip.opacity))
+        return tuple(key)
+    
+    def _on_frame_done(self, future, cache_key: tuple):
+        """渲染完成（主线程）：写入缓存并发出结果"""
         try:
-            # 找到当前时间点的活动剪辑
-            active_clips = self._get_active_clips_at_time(time_seconds)
+            image = future.result()
+            # QPixmap 只能在主线程创建；这里的转换也是画布像素唯一的一次复制
+            pixmap = QPixmap.fromImage(image) if image is not None else None
+            if pixmap:
+                # 渲染期间分辨率已改变时，结果的尺寸与键不符，不写入缓存
+                if cache_key[0] == self.resolution:
+                    # 添加到缓存，超出上限时移除最久未用的项
+                    self.frame_cache[cache_key] = pixmap
+                    self.frame_cache.move_to_end(cache_key)
+                    while len(self.frame_cache) > self.cache_size_limit:
+                        self.frame_cache.popitem(last=False)
+                self.frameReady.emit(pixmap)
+            else:
+                self.renderError.emit("渲染失败")
+        except Exception as e:
+            self.renderError.emit(f"渲染错误: {str(e)}")
+        finally:
+            self.is_rendering = False
             
-            if not active_clips:
+            # 拖动播放头期间积压的请求只保留最后一个
+            pending, self._pending_time = self._pending_time, None
+            if pending is not None:
+                self.render_frame_at_time(pending)
+        
+    def frame_at(self, time_seconds: float) -> Optional[QPixmap]:
+        """同步物化指定时间点的帧（须在主线程调用），只解码覆盖该时刻的剪辑"""
+        # 找到当前时间点的活动剪切（已按轨道排序）
+        image = self._render_cuts(self.spec.cuts_at(time_seconds), time_seconds)
+        return QPixmap.fromImage(image) if image is not None else None
+    
+    def _render_cuts(self, active_cuts: List[TimelineCut], time_seconds: float) -> Optional[QImage]:
+        """渲染已定位好的活动剪切（在线程中执行，只产生 QImage）"""
+        try:
+            if not active_cuts:
                 # 没有活动剪辑，返回黑色帧
                 return self._create_black_frame()
-                
-            # 按轨道排序（轨道号越大越在上层）
-            active_clips.sort(key=lambda c: c.track)
             
             # 渲染合成帧
-            return self._composite_clips(active_clips, time_seconds)
+            return self._composite_clips(active_cuts, time_seconds)
             
         except Exception as e:
             print(f"渲染帧时出错: {e}")
             return None
             
-    def _get_active_clips_at_time(self, time_seconds: float) -> List[TimelineClip]:
-        """获取指定时间点的活动剪辑"""
-        active_clips = []
-        for clip in self.clips:
-            if clip.start_time <= time_seconds < clip.end_time:
-                active_clips.append(clip)
-        return active_clips
-        
-    def _composite_clips(self, clips: List[TimelineClip], time_seconds: float) -> Optional[QPixmap]:
+    def _next_canvas(self) -> np.ndarray:
+        """取出画布环中的下一块画布，分辨率改变时重新分配"""
+        width, height = self.resolution
+        with self._ring_lock:
+            if not self._canvas_ring or self._canvas_ring[0].shape[:2] != (height, width):
+                self._canvas_ring = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(3)]
+                self._ring_idx = 0
+            canvas = self._canvas_ring[self._ring_idx]
+            self._ring_idx = (self._ring_idx + 1) % len(self._canvas_ring)
+        return canvas
+    
+    def _composite_clips(self, cuts: List[TimelineCut], time_seconds: float) -> Optional[QImage]:
         """合成多个剪辑"""
         if not self.cv2_available:
             # 如果OpenCV不可用，使用简化渲染
-            return self._simple_render(clips, time_seconds)
+            return self._simple_render([cut.clip for cut in cuts], time_seconds)
             
         try:
-            # 创建输出画布
-            canvas = np.zeros((self.resolution[1], self.resolution[0], 3), dtype=np.uint8)
-            
-            for clip in clips:
-                # 计算剪辑内的相对时间
-                clip_time = time_seconds - clip.start_time + clip.in_point
-                
-                # 渲染剪辑帧
-                clip_frame = self._render_clip_frame(clip, clip_time)
-                if clip_frame is not None:
-                    # 合成到画布上
-                    canvas = self._blend_frame(canvas, clip_frame, clip.track)
+            # 复用画布环中的画布，每帧只清零不重新分配
+            canvas = self._next_canvas()
+            
+            # 每一层都缩放到整个画布，最上面的不透明层以下的剪辑完全被遮住，不必解码；
+            # 该层解码失败时再从最底层完整合成一次
+            start = self._covering_cut_index(cuts)
+            for begin in ((start, 0) if start else (0,)):
+                canvas.fill(0)
+                if self._blend_cuts(canvas, cuts[begin:], time_seconds):
+                    break
                     
-            # 转换为QPixmap
-            return self._numpy_to_qpixmap(canvas)
+            # 包装为引用画布的 QImage，不复制像素
+            return self._numpy_to_qimage(canvas)
             
         except Exception as e:
             print(f"合成剪辑时出错: {e}")
             return self._create_black_frame()
             
+    @staticmethod
+    def _covering_cut_index(cuts: List[TimelineCut]) -> int:
+        """返回最上面一个会盖住整个画布的剪切（不透明的视频或图片）的下标，没有则为 0"""
+        for i in range(len(cuts) - 1, -1, -1):
+            clip = cuts[i].clip
+            if clip.opacity >= 1.0 and clip.media_item.media_type in ('video', 'image'):
+                return i
+        return 0
+    
+    def _blend_cuts(self, canvas: np.ndarray, cuts: List[TimelineCut], time_seconds: float) -> bool:
+        """自下而上把剪切合成到画布上，返回最底层的剪切是否成功渲染
+        
+        多层时各层的帧并行解码（各自打开不同的文件，互不依赖），按轨道顺序合成。
+        """
+        if len(cuts) >= 2 and _DECODE_POOL is not None:
+            # map 按提交顺序返回结果，保持层叠顺序
+            frames = _DECODE_POOL.map(self._decode_cut_frame, cuts, itertools.repeat(time_seconds))
+        else:
+            # 单层时逐个解码并立即合成
+            frames = (self._render_clip_frame(cut.clip, cut.source_time(time_seconds)) for cut in cuts)
+        
+        first_rendered = False
+        for i, (cut, clip_frame) in enumerate(zip(cuts, frames)):
+            if clip_frame is not None:
+                # 合成到画布上
+                self._blend_frame(canvas, clip_frame, cut.clip.track, cut.clip.opacity)
+                first_rendered = first_rendered or i == 0
+        return first_rendered
+    
+    def _decode_cut_frame(self, cut: TimelineCut, time_seconds: float) -> Optional[np.ndarray]:
+        """在解码线程池中渲染一层的帧
+        
+        缩放结果写在线程自己的缓冲区里，该线程接着解码另一层时会被覆盖，
+        因此这种情况下复制一份再交给合成。
+        """
+        frame = self._render_clip_frame(cut.clip, cut.source_time(time_seconds))
+        if frame is not None and frame is getattr(self._scratch, 'buffer', None):
+            frame = frame.copy()
+        return frame
+    
     def _render_clip_frame(self, clip: TimelineClip, clip_time: float) -> Optional[np.ndarray]:
         """渲染单个剪辑的帧"""
         try:
             if clip.media_item.media_type == 'video':
                 return self._extract_video_frame(clip.media_item.file_path, clip_time)
             elif clip.media_item.media_type == 'image':
-                return self._load_image_frame(clip.media_item.file_path)
+                return self._load_image_frame(clip.media_item)
             else:
                 # 音频或其他类型，返回透明帧
                 return None
@@ -488,33 +1541,137 @@ class TimelineRenderer(QObject):
             return None
             
     def _extract_video_frame(self, video_path: str, time_seconds: float) -> Optional[np.ndarray]:
-        """从视频文件提取指定时间的帧"""
+        """从视频文件提取指定时间的帧，优先使用 PyAV，失败时回退到 OpenCV"""
+        if self.use_pyav:
+            frame = self._extract_video_frame_av(str(video_path), time_seconds)
+            if frame is not None:
+                return frame
+        return self._extract_video_frame_cv2(video_path, time_seconds)
+    
+    def _get_av_reader(self, video_path: str):
+        """获取（必要时打开）文件对应的 PyAV 容器，超过上限时关闭最久未用的容器"""
+        with self._av_readers_lock:
+            reader = self._av_readers.get(video_path)
+            if reader is not None:
+                self._av_readers.move_to_end(video_path)
+                return reader
+            
+            container = av.open(video_path)
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            # [容器, 视频流, 锁, 当前解码迭代器, 上次返回帧的 pts,
+            #  本次连续解码中最近的关键帧 pts, 相邻关键帧的间隔 (pts)]
+            reader = [container, stream, threading.Lock(), None, None, None, None]
+            self._av_readers[video_path] = reader
+            
+            while len(self._av_readers) > self.AV_READER_CACHE_SIZE:
+                _, (old_container, _, old_lock, *_) = self._av_readers.popitem(last=False)
+                with old_lock:
+                    old_container.close()
+            return reader
+    
+    def close_readers(self):
+        """关闭所有缓存的解码器"""
+        with self._av_readers_lock:
+            for container, _, lock, *_ in self._av_readers.values():
+                with lock:
+                    container.close()
+            self._av_readers.clear()
+    
+    def _extract_video_frame_av(self, video_path: str, time_seconds: float) -> Optional[np.ndarray]:
+        """用 PyAV 定位到前一个关键帧，再向后解码到目标时间
+        
+        目标在上次位置之后不远，或仍在当前关键帧间隔 (GOP) 内时，直接沿用当前解码器
+        继续向后解码：重新定位只会回到同一个关键帧，从头再解码一遍。
+        """
         try:
-            cap = cv2.VideoCapture(str(video_path))
-            if not cap.isOpened():
-                return None
+            reader = self._get_av_reader(video_path)
+            container, stream, lock = reader[0], reader[1], reader[2]
+            with lock:
+                time_base = stream.time_base
+                start_pts = stream.start_time or 0
+                target_pts = start_pts + int(time_seconds / time_base)
+                rate = stream.average_rate or 30
+                frame_pts = 1 / (rate * time_base)
+                # 允许半帧误差，避免因时间戳取整跳过目标帧
+                tolerance = int(frame_pts / 2)
+                
+                decoder, last_pts, last_key_pts, gop_pts = reader[3], reader[4], reader[5], reader[6]
+                sequential = (
+                    decoder is not None and last_pts is not None and target_pts > last_pts
+                    and (target_pts - last_pts < self.SEQUENTIAL_GRAB_LIMIT * frame_pts
+                         or (last_key_pts is not None and gop_pts is not None
+                             and target_pts < last_key_pts + gop_pts))
+                )
+                if not sequential:
+                    container.seek(target_pts, backward=True, any_frame=False, stream=stream)
+                    decoder = reader[3] = container.decode(stream)
+                    # 定位后重新开始记录关键帧，间隔只在连续解码中测量
+                    reader[5] = None
+                
+                frame = None
+                for frame in decoder:
+                    if frame.key_frame and frame.pts is not None:
+                        if reader[5] is not None and frame.pts > reader[5]:
+                            reader[6] = frame.pts - reader[5]
+                        reader[5] = frame.pts
+                    if frame.pts is not None and frame.pts + tolerance >= target_pts:
+                        break
+                else:
+                    frame = None
+                reader[4] = frame.pts if frame is not None else None
+                if frame is None:
+                    reader[3] = None
+                    return None
                 
-            # 获取原始视频尺寸
-            original_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            original_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                # 渲染管线统一使用 BGR，与 OpenCV 一致，交给 Qt 时无需再交换通道；
+                # 缩放和颜色转换在 swscale 中一次完成，不再输出原始分辨率的帧后另行 resize
+                width, height = self.resolution
+                downscale = width < frame.width or height < frame.height
+                return frame.to_ndarray(width=width, height=height, format='bgr24',
+                                        interpolation='AREA' if downscale else 'BICUBIC')
+            
+        except Exception as e:
+            print(f"PyAV 提取视频帧失败，回退到 OpenCV {video_path}: {e}")
+            return None
+    
+    def _extract_video_frame_cv2(self, video_path: str, time_seconds: float) -> Optional[np.ndarray]:
+        """用 OpenCV 从视频文件提取指定时间的帧
+        
+        向前小步拖动时，只用 grab() 跳过中间帧，最后一帧才 retrieve()，避免每次都从关键帧重新解码。
+        """
+        try:
+            path = str(video_path)
+            with self._cap_cache_lock:
+                cap, last_frame = self._cap_cache.pop(path, (None, -1))
+            if cap is None:
+                cap = _open_video_capture(path)
+                if not cap.isOpened():
+                    return None
                 
-            # 设置到指定时间
             fps = cap.get(cv2.CAP_PROP_FPS)
             frame_number = int(time_seconds * fps)
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            step = frame_number - last_frame
+            if 0 < step < self.SEQUENTIAL_GRAB_LIMIT:
+                # 读指针停在 last_frame + 1，跳过中间帧
+                for _ in range(step - 1):
+                    cap.grab()
+            else:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
             
-            ret, frame = cap.read()
-            cap.release()
+            # grab() 只推进码流，retrieve() 才解码出像素
+            ret = cap.grab()
+            if ret:
+                ret, frame = cap.retrieve()
+            
+            with self._cap_cache_lock:
+                previous = self._cap_cache.get(path)
+                self._cap_cache[path] = (cap, frame_number if ret else -1)
+            if previous is not None:
+                previous[0].release()
             
             if ret:
-                # 只有当目标分辨率小于原始分辨率时才进行缩放
-                if self.resolution[0] < original_width or self.resolution[1] < original_height:
-                    # 使用高质量插值算法进行缩放
-                    frame_resized = cv2.resize(frame, self.resolution, interpolation=cv2.INTER_LANCZOS4)
-                else:
-                    # 保持原始尺寸或进行高质量放大
-                    frame_resized = cv2.resize(frame, self.resolution, interpolation=cv2.INTER_CUBIC)
-                return cv2.cvtColor(frame_resized, cv2.COLOR_BGR2RGB)
+                return self._resize_to_output(frame)
             else:
                 return None
                 
@@ -522,22 +1679,21 @@ class TimelineRenderer(QObject):
             print(f"提取视频帧时出错: {e}")
             return None
             
-    def _load_image_frame(self, image_path: str) -> Optional[np.ndarray]:
+    def _load_image_frame(self, media_item: MediaItem) -> Optional[np.ndarray]:
         """加载图片帧"""
+        image_path = media_item.file_path
         try:
+            if PIL_AVAILABLE and media_item.suffix_lower in ('.jpg', '.jpeg'):
+                with Image.open(image_path) as img:
+                    # libjpeg 在 DCT 阶段按 1/2、1/4、1/8 缩小解码，不再生成原始分辨率的中间图
+                    img.draft('RGB', self.resolution)
+                    rgb = np.asarray(img.convert('RGB'))
+                return self._resize_to_output(cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR))
+            
+            # PNG/BMP 等没有 DCT 缩放，仍用 OpenCV 完整解码
             image = cv2.imread(str(image_path))
             if image is not None:
-                # 获取原始图片尺寸
-                original_height, original_width = image.shape[:2]
-                
-                # 使用高质量插值算法进行缩放
-                if self.resolution[0] < original_width or self.resolution[1] < original_height:
-                    # 缩小时使用LANCZOS4算法
-                    image_resized = cv2.resize(image, self.resolution, interpolation=cv2.INTER_LANCZOS4)
-                else:
-                    # 放大时使用CUBIC算法
-                    image_resized = cv2.resize(image, self.resolution, interpolation=cv2.INTER_CUBIC)
-                return cv2.cvtColor(image_resized, cv2.COLOR_BGR2RGB)
+                return self._resize_to_output(image)
             else:
                 return None
                 
@@ -545,25 +1701,56 @@ class TimelineRenderer(QObject):
             print(f"加载图片帧时出错: {e}")
             return None
             
-    def _blend_frame(self, canvas: np.ndarray, frame: np.ndarray, track: int) -> np.ndarray:
-        """将帧混合到画布上"""
-        # 简单的覆盖混合（后续可以添加更复杂的混合模式）
-        return frame
+    def _resize_to_output(self, frame: np.ndarray) -> np.ndarray:
+        """把 BGR 帧缩放到输出分辨率，结果写入当前线程的缩放缓冲区
         
-    def _numpy_to_qpixmap(self, array: np.ndarray) -> QPixmap:
-        """将numpy数组转换为QPixmap"""
+        返回的数组会被同一线程的下一次缩放覆盖，调用方需在此之前用完。
+        """
+        width, height = self.resolution
+        src_height, src_width = frame.shape[:2]
+        if (src_width, src_height) == (width, height):
+            return frame
+        
+        scratch = getattr(self._scratch, 'buffer', None)
+        if scratch is None or scratch.shape[:2] != (height, width):
+            scratch = np.empty((height, width, 3), dtype=np.uint8)
+            self._scratch.buffer = scratch
+        
+        # 缩小用 INTER_AREA（无摩尔纹且更快），放大用 CUBIC
+        if width < src_width or height < src_height:
+            interpolation = cv2.INTER_AREA
+        else:
+            interpolation = cv2.INTER_CUBIC
+        return cv2.resize(frame, (width, height), dst=scratch, interpolation=interpolation)
+    
+    def _blend_frame(self, canvas: np.ndarray, frame: np.ndarray, track: int,
+                     opacity: float = 1.0) -> np.ndarray:
+        """将帧按不透明度原地混合到画布上"""
+        alpha = int(round(max(0.0, min(1.0, opacity)) * 255))
+        if alpha == 255:
+            # 完全不透明时直接覆盖
+            np.copyto(canvas, frame)
+        elif alpha > 0:
+            blend_over(canvas, frame, alpha)
+        return canvas
+        
+    def _numpy_to_qimage(self, array: np.ndarray) -> QImage:
+        """把 BGR numpy 数组包装为 QImage（Qt 原生支持 BGR888，无需交换通道）
+        
+        QImage 直接引用数组内存，不复制像素；数组必须在转换为 QPixmap 之前保持不变，
+        画布环保证了这一点。
+        """
         height, width, channel = array.shape
-        bytes_per_line = 3 * width
-        q_image = QImage(array.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-        return QPixmap.fromImage(q_image)
+        bytes_per_line = array.strides[0]
+        return QImage(array.data, width, height, bytes_per_line, QImage.Format.Format_BGR888)
         
-    def _create_black_frame(self) -> QPixmap:
+    def _create_black_frame(self) -> QImage:
         """创建黑色帧"""
-        pixmap = QPixmap(self.resolution[0], self.resolution[1])
-        pixmap.fill(Qt.GlobalColor.black)
-        return pixmap
+        image = QImage(self.resolution[0], self.resolution[1], QImage.Format.Format_RGB32)
+        image.fill(Qt.GlobalColor.black)
+        return image
         
-    def _simple_render(self, clips: List[TimelineClip], time_seconds: float) -> Optional[QPixmap]:
+    def _simple_render(self, clips: List[TimelineClip], time_seconds: float) -> Optional[QImage]:
         """简化渲染（当OpenCV不可用时）"""
         if not clips:
             return self._create_black_frame()
@@ -571,8 +1758,8 @@ class TimelineRenderer(QObject):
         # 选择最上层的剪辑
         top_clip = max(clips, key=lambda c: c.track)
         
-        # 尝试加载媒体文件的缩略图
-        thumbnail = top_clip.media_item.generate_thumbnail(self.resolution)
+        # 尝试加载媒体文件的缩略图（QImage 版本，可在工作线程中调用）
+        thumbnail = top_clip.media_item.generate_thumbnail_image(self.resolution)
         if thumbnail:
             return thumbnail.scaled(
                 self.resolution[0], self.resolution[1],
@@ -582,6 +1769,32 @@ class TimelineRenderer(QObject):
         else:
             return self._create_black_frame()
 
+class ThumbnailSignals(QObject):
+    """缩略图后台任务的信号"""
+    
+    done = pyqtSignal(int, object, QImage)  # 媒体索引, MediaItem, 缩略图
+
+class ThumbnailTask(QRunnable):
+    """在线程池中生成媒体缩略图"""
+    
+    def __init__(self, index: int, media_item: MediaItem, size: Tuple[int, int], signals: ThumbnailSignals):
+        super().__init__()
+        self.index = index
+        self.media_item = media_item
+        self.size = size
+        self.signals = signals
+    
+    def run(self):
+        try:
+            # 延迟到这里读取元数据，导入时列表项可以先显示出来；
+            # 读取元数据打开的 VideoCapture 留给紧接着的缩略图生成复用
+            self.media_item.ensure_metadata(keep_capture=True)
+            image = self.media_item.generate_thumbnail_image(self.size)
+        finally:
+            self.media_item.release_capture()
+        # 失败时发送空 QImage，让接收方也能结束等待状态
+        self.signals.done.emit(self.index, self.media_item, image if image is not None else QImage())
+
 class CustomMediaListWidget(QListWidget):
     """自定义媒体列表组件，重写拖拽方法"""
     
@@ -628,9 +1841,48 @@ class MediaLibraryWidget(QWidget):
     
     media_dropped = pyqtSignal(str, int)  # 文件路径, 轨道号
     
+    # 媒体库列表中缩略图的尺寸
+    THUMBNAIL_SIZE = (120, 90)
+    # 悬停预览弹窗中缩略图的尺寸
+    PREVIEW_THUMBNAIL_SIZE = (200, 150)
+    # 批量导入时每轮事件循环插入的文件数，其余文件留到下一轮，界面保持响应
+    IMPORT_BATCH_SIZE = 16
+    
+    # 各媒体类型的默认图标，所有媒体库实例共用，首次创建实例时绘制
+    _DEFAULT_ICONS: Dict[str, QIcon] = {}
+    
     def __init__(self):
         super().__init__()
         self.media_items: List[MediaItem] = []
+        
+        # QPixmap 需要 QApplication 已经存在，因此不在类定义时绘制
+        if not MediaLibraryWidget._DEFAULT_ICONS:
+            for media_type in ('video', 'audio', 'image', 'unknown'):
+                MediaLibraryWidget._DEFAULT_ICONS[media_type] = QIcon(self._render_default_icon(media_type))
+        
+        # 缩略图在专用线程池中生成，完成后通过信号回到主线程更新图标；
+        # 线程数不超过 CPU 核数，清空媒体库时可以直接丢弃排队中的任务
+        self._thumb_pool = QThreadPool(self)
+        self._thumb_pool.setMaxThreadCount(os.cpu_count() or 2)
+        self.thumbnail_signals = ThumbnailSignals()
+        self.thumbnail_signals.done.connect(self.on_thumbnail_ready)
+        # 悬停预览的大缩略图同样在线程池中生成
+        self.preview_thumbnail_signals = ThumbnailSignals()
+        self.preview_thumbnail_signals.done.connect(self.on_preview_thumbnail_ready)
+        self._preview_label = None
+        self._preview_media = None
+        
+        # 等待分批插入的文件路径，见 add_media_paths
+        self._pending_imports = deque()
+        self._import_total = 0
+        
+        # 缩略图只为滚动到可见区域的行生成；已提交任务的媒体索引记录在这里
+        self._thumbnails_requested = set()
+        self._visible_thumb_timer = QTimer(self)
+        self._visible_thumb_timer.setSingleShot(True)
+        self._visible_thumb_timer.setInterval(30)
+        self._visible_thumb_timer.timeout.connect(self._start_visible_thumbnails)
+        
         self.setup_ui()
         self.setAcceptDrops(True)
         
@@ -734,6 +1986,13 @@ class MediaLibraryWidget(QWidget):
         """)
         
         layout.addWidget(self.media_list)
+        self.media_list.verticalScrollBar().valueChanged.connect(self._schedule_visible_thumbnails)
+        
+        # 大批量导入时显示进度，插入完成后隐藏
+        self.import_progress = QProgressBar()
+        self.import_progress.setFormat("导入中 %v/%m")
+        self.import_progress.hide()
+        layout.addWidget(self.import_progress)
     
     def import_media(self):
         """导入媒体文件"""
@@ -741,19 +2000,64 @@ class MediaLibraryWidget(QWidget):
             self,
             "选择媒体文件",
             "",
-            "媒体文件 (*.mp4 *.avi *.mov *.mkv *.wmv *.flv *.m4v *.webm *.mp3 *.wav *.aac *.m4a *.flac *.ogg *.jpg *.jpeg *.png *.bmp *.gif *.tiff);;" +
-            "视频文件 (*.mp4 *.avi *.mov *.mkv *.wmv *.flv *.m4v *.webm);;" +
-            "音频文件 (*.mp3 *.wav *.aac *.m4a *.flac *.ogg);;" +
-            "图片文件 (*.jpg *.jpeg *.png *.bmp *.gif *.tiff);;" +
-            "所有文件 (*)"
+            _IMPORT_NAME_FILTERS
         )
         
-        for file_path in file_paths:
-            self.add_media_item(file_path)
-            # 标记项目为已修改
-            main_window = self.get_main_window()
-            if main_window:
-                main_window.mark_project_modified()
+        if not file_paths:
+            return
+        
+        self.add_media_paths(file_paths)
+        # 标记项目为已修改
+        main_window = self.get_main_window()
+        if main_window:
+            main_window.mark_project_modified()
+    
+    def add_media_paths(self, file_paths: List[str]):
+        """批量添加多个媒体文件
+        
+        文件按 IMPORT_BATCH_SIZE 分批插入，第一批立即插入，其余每轮事件循环插入一批，
+        拖入上千个文件时界面也不会卡住。元数据由后台缩略图任务读取，列表项先只显示
+        文件名，读取完成后再补全。
+        """
+        # 每个路径只按扩展名分类一次，下面的预读都复用这个结果
+        media_types = [(path, _EXT_MEDIA_TYPE.get(Path(path).suffix.lower())) for path in file_paths]
+        
+        # 先让内核一次性预读所有文件头，后台任务读取时不必逐个等待磁盘
+        _prefetch_file_heads([path for path, media_type in media_types if media_type])
+        
+        # 一次查询预读已缓存的缩略图，后台任务随后直接命中内存
+        thumbnail_cache.prefetch([
+            ThumbnailCache.make_key(Path(path), self.THUMBNAIL_SIZE)
+            for path, media_type in media_types
+            if media_type in ('video', 'image')
+        ])
+        
+        # 队列非空说明上一次导入仍在分批进行，追加后由已安排的下一轮继续处理
+        draining = bool(self._pending_imports)
+        self._pending_imports.extend(file_paths)
+        self._import_total += len(file_paths)
+        if not draining:
+            self._drain_pending_imports()
+    
+    def _drain_pending_imports(self):
+        """插入一批等待中的文件，还有剩余时安排到下一轮事件循环继续"""
+        # 不屏蔽模型信号：视图需要 rowsInserted 来同步行数，只合并重绘即可
+        self.media_list.setUpdatesEnabled(False)
+        try:
+            for _ in range(min(self.IMPORT_BATCH_SIZE, len(self._pending_imports))):
+                self._add_media_item_from_path(self._pending_imports.popleft())
+        finally:
+            self.media_list.setUpdatesEnabled(True)
+            self.media_list.viewport().update()
+        
+        if self._pending_imports:
+            self.import_progress.setMaximum(self._import_total)
+            self.import_progress.setValue(self._import_total - len(self._pending_imports))
+            self.import_progress.show()
+            QTimer.singleShot(0, self._drain_pending_imports)
+        else:
+            self._import_total = 0
+            self.import_progress.hide()
     
 
     
@@ -779,6 +2083,8 @@ class MediaLibraryWidget(QWidget):
         # 更新媒体列表的图标和网格尺寸
         self.media_list.setIconSize(QSize(new_icon_width, new_icon_height))
         self.media_list.setGridSize(QSize(new_grid_width, new_grid_height))
+        # 图标变小后一屏能显示更多行
+        self._schedule_visible_thumbnails()
         
         print(f"媒体库缩放已更改为: {zoom_value}% (图标: {new_icon_width}x{new_icon_height}, 网格: {new_grid_width}x{new_grid_height})")
     
@@ -814,6 +2120,8 @@ class MediaLibraryWidget(QWidget):
         """隐藏悬停预览"""
         self.preview_timer.stop()
         self.hover_item = None
+        self._preview_label = None
+        self._preview_media = None
         if self.preview_popup:
             self.preview_popup.hide()
             self.preview_popup = None
@@ -832,21 +2140,29 @@ class MediaLibraryWidget(QWidget):
         layout.setContentsMargins(5, 5, 5, 5)
         
         # 预览标签
-        preview_label = QLabel()
-        preview_label.setFixedSize(200, 150)
-        preview_label.setStyleSheet("border: 1px solid #ccc; background-color: black;")
+        preview_label = QLabel("加载中...")
+        preview_label.setFixedSize(*self.PREVIEW_THUMBNAIL_SIZE)
+        preview_label.setStyleSheet("border: 1px solid #ccc; background-color: black; color: #ccc;")
         preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # 加载视频缩略图
-        thumbnail = media_item.generate_thumbnail((200, 150))
-        if thumbnail:
-            preview_label.setPixmap(thumbnail)
-        else:
-            preview_label.setText("无法预览")
-            preview_label.setStyleSheet("border: 1px solid #ccc; background-color: #f0f0f0; color: #666;")
-        
         layout.addWidget(preview_label)
         
+        # 列表缩略图已生成时，先快速放大显示，后台生成的清晰版本完成后再替换
+        if media_item.thumbnail is not None:
+            preview_label.setPixmap(media_item.thumbnail.scaled(
+                *self.PREVIEW_THUMBNAIL_SIZE,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation
+            ))
+        
+        # 在后台线程解码视频缩略图，弹窗先显示出来，完成后再填入
+        self._preview_label = preview_label
+        self._preview_media = media_item
+        # 优先于排队中的列表缩略图执行
+        self._thumb_pool.start(
+            ThumbnailTask(-1, media_item, self.PREVIEW_THUMBNAIL_SIZE, self.preview_thumbnail_signals),
+            1
+        )
+        
         # 媒体信息
         info_label = QLabel()
         info_text = f"<b>{media_item.name}</b><br>"
@@ -917,8 +2233,8 @@ class MediaLibraryWidget(QWidget):
                 main_window.video_preview.disable_timeline_preview()
                 # 加载并播放媒体
                 main_window.video_preview.load_media(media_item.file_path)
-                # 延迟播放，等待加载完成
-                QTimer.singleShot(500, lambda: main_window.video_preview.media_player.play())
+                # 加载完成后再播放
+                main_window.video_preview.play_when_loaded()
                 print(f"预览播放: {media_item.name}")
         except Exception as e:
             print(f"预览播放媒体时出错: {e}")
@@ -953,24 +2269,27 @@ class MediaLibraryWidget(QWidget):
             
             layout = QVBoxLayout(dialog)
             
-            # 创建属性文本
-            properties_text = f"<h3>{media_item.name}</h3>"
-            properties_text += f"<b>文件路径:</b> {media_item.file_path}<br><br>"
-            properties_text += f"<b>媒体类型:</b> {media_item.media_type}<br>"
+            # 创建属性文本，各段收集后一次拼接
+            duration, width, height = media_item.duration, media_item.width, media_item.height
+            file_size = media_item.file_size
+            properties_parts = [
+                f"<h3>{media_item.name}</h3>",
+                f"<b>文件路径:</b> {media_item.file_path}<br><br>",
+                f"<b>媒体类型:</b> {media_item.media_type}<br>",
+            ]
             
-            if media_item.duration > 0:
-                properties_text += f"<b>时长:</b> {media_item.duration:.2f} 秒<br>"
+            if duration > 0:
+                properties_parts.append(f"<b>时长:</b> {duration:.2f} 秒<br>")
             
-            if media_item.width > 0 and media_item.height > 0:
-                properties_text += f"<b>分辨率:</b> {media_item.width} x {media_item.height}<br>"
+            if width > 0 and height > 0:
+                properties_parts.append(f"<b>分辨率:</b> {width} x {height}<br>")
             
-            if media_item.file_size > 0:
-                size_mb = media_item.file_size / (1024 * 1024)
-                properties_text += f"<b>文件大小:</b> {size_mb:.1f} MB<br>"
+            if file_size > 0:
+                properties_parts.append(f"<b>文件大小:</b> {file_size / (1024 * 1024):.1f} MB<br>")
             
-            properties_text += f"<b>文件格式:</b> {media_item.file_path.suffix.lower()}<br>"
+            properties_parts.append(f"<b>文件格式:</b> {media_item.suffix_lower}<br>")
             
-            properties_label = QLabel(properties_text)
+            properties_label = QLabel("".join(properties_parts))
             properties_label.setWordWrap(True)
             properties_label.setAlignment(Qt.AlignmentFlag.AlignTop)
             layout.addWidget(properties_label)
@@ -987,6 +2306,12 @@ class MediaLibraryWidget(QWidget):
     
     def _create_default_icon(self, list_item: QListWidgetItem, media_type: str):
         """为无法生成缩略图的文件创建默认图标"""
+        # 同类型的默认图标完全相同，直接复用预先绘制好的 QIcon
+        icon = self._DEFAULT_ICONS.get(media_type, self._DEFAULT_ICONS['unknown'])
+        list_item.setIcon(icon)
+    
+    def _render_default_icon(self, media_type: str) -> QPixmap:
+        """绘制默认图标"""
         pixmap = QPixmap(120, 90)
         
         if media_type == 'video':
@@ -1008,7 +2333,7 @@ class MediaLibraryWidget(QWidget):
         painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, icon_text)
         painter.end()
         
-        list_item.setIcon(QIcon(pixmap))
+        return pixmap
     
 
     
@@ -1037,15 +2362,14 @@ class MediaLibraryWidget(QWidget):
     
     def get_main_window(self):
         """获取主窗口引用"""
-        widget = self
-        while widget.parent():
-            widget = widget.parent()
-            if isinstance(widget, QMainWindow):
-                return widget
-        return None
+        return MainWindow.instance()
     
     def clear_media(self):
         """清空媒体库"""
+        # 丢弃尚未开始的缩略图任务，已在运行的任务完成后会被 on_thumbnail_ready 忽略
+        self._thumb_pool.clear()
+        self._pending_imports.clear()
+        self._thumbnails_requested.clear()
         self.media_items.clear()
         self.media_list.clear()
         self.hide_hover_preview()
@@ -1061,23 +2385,17 @@ class MediaLibraryWidget(QWidget):
     
     def _add_media_item_from_path(self, file_path: str):
         """从文件路径添加媒体项目"""
-        # 创建媒体项目并验证文件类型
-        media_item = MediaItem(file_path)
-        
-        # 检查是否为有效的媒体文件
-        if not media_item.is_valid_media_file():
-            from PyQt6.QtWidgets import QMessageBox
+        # 先按扩展名检查，无效文件不必创建 MediaItem 读取元数据
+        if not is_valid_media_path(file_path):
             QMessageBox.warning(
                 self,
                 "无效文件类型",
-                f"文件 '{media_item.name}' 不是支持的媒体文件类型。\n\n"
-                f"支持的格式：\n"
-                f"• 视频：mp4, avi, mov, mkv, wmv, flv, m4v, webm\n"
-                f"• 音频：mp3, wav, aac, m4a, flac, ogg\n"
-                f"• 图片：jpg, jpeg, png, bmp, gif, tiff"
+                _INVALID_FILE_MSG_TEMPLATE.format(name=Path(file_path).name)
             )
             return
         
+        # 创建媒体项目（不读取元数据），元数据由后台缩略图任务读取
+        media_item = MediaItem(file_path)
         self._add_media_item_object(media_item)
     
     def _add_media_item_object(self, media_item: MediaItem):
@@ -1087,10 +2405,74 @@ class MediaLibraryWidget(QWidget):
         # 创建列表项
         list_item = QListWidgetItem()
         
-        # 简化文本显示，重点突出文件名
+        media_index = len(self.media_items) - 1
+        list_item.setData(Qt.ItemDataRole.UserRole, media_index)
+        
+        # 先显示默认图标，缩略图生成后再替换
+        self._create_default_icon(list_item, media_item.media_type)
+        
+        if media_item.metadata_loaded:
+            self._describe_list_item(list_item, media_item)
+        else:
+            # 元数据在后台读取，完成后由 on_thumbnail_ready 补全文字和提示
+            list_item.setText(f"{self._short_name(media_item)}\n读取中...")
+            list_item.setToolTip(f"文件: {media_item.name}\n路径: {media_item.file_path}")
+        
+        self.media_list.addItem(list_item)
+        
+        # 行进入可见区域后才在后台读取元数据并生成缩略图
+        self._schedule_visible_thumbnails()
+    
+    def _schedule_visible_thumbnails(self):
+        """合并滚动、缩放和插入触发的请求，稍后统一检查可见行"""
+        self._visible_thumb_timer.start()
+    
+    def _start_visible_thumbnails(self):
+        """为当前可见且尚未请求过的行提交缩略图任务"""
+        count = self.media_list.count()
+        if count == 0:
+            return
+        
+        # 图标模式按行从左到右排列，各项的纵坐标随行号单调不减，二分找到第一个可见行
+        viewport_rect = self.media_list.viewport().rect()
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.media_list.visualItemRect(self.media_list.item(mid)).bottom() < viewport_rect.top():
+                lo = mid + 1
+            else:
+                hi = mid
+        
+        for row in range(lo, count):
+            if self.media_list.visualItemRect(self.media_list.item(row)).top() > viewport_rect.bottom():
+                break
+            if row in self._thumbnails_requested:
+                continue
+            self._thumbnails_requested.add(row)
+            self._thumb_pool.start(
+                ThumbnailTask(row, self.media_items[row], self.THUMBNAIL_SIZE, self.thumbnail_signals)
+            )
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_visible_thumbnails()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_visible_thumbnails()
+    
+    @staticmethod
+    def _short_name(media_item: MediaItem) -> str:
+        """列表中显示的文件名，过长时截断"""
         file_name = media_item.name
         if len(file_name) > 15:
             file_name = file_name[:12] + "..."
+        return file_name
+    
+    def _describe_list_item(self, list_item: QListWidgetItem, media_item: MediaItem):
+        """根据元数据设置列表项的文字和工具提示"""
+        # 简化文本显示，重点突出文件名
+        file_name = self._short_name(media_item)
         
         # 根据媒体类型显示不同信息
         if media_item.media_type == 'video':
@@ -1106,30 +2488,52 @@ class MediaLibraryWidget(QWidget):
         else:
             list_item.setText(f"{file_name}\n未知格式")
         
-        list_item.setData(Qt.ItemDataRole.UserRole, len(self.media_items) - 1)
+        # 设置工具提示显示完整信息，各行收集后一次拼接
+        duration, width, height = media_item.duration, media_item.width, media_item.height
+        file_size = media_item.file_size
+        tooltip_lines = [
+            f"文件: {media_item.name}",
+            f"路径: {media_item.file_path}",
+            f"类型: {media_item.media_type}",
+        ]
+        if duration > 0:
+            tooltip_lines.append(f"时长: {duration:.2f}秒")
+        if width > 0 and height > 0:
+            tooltip_lines.append(f"分辨率: {width}x{height}")
+        if file_size > 0:
+            tooltip_lines.append(f"大小: {file_size / (1024 * 1024):.1f}MB")
+        list_item.setToolTip("\n".join(tooltip_lines))
+    
+    def on_thumbnail_ready(self, media_index: int, media_item: MediaItem, image: QImage):
+        """缩略图生成完成，替换列表项图标"""
+        # 媒体库可能已被清空或重新加载
+        if media_index >= len(self.media_items) or self.media_items[media_index] is not media_item:
+            return
         
-        # 生成更大尺寸的缩略图
-        thumbnail = media_item.generate_thumbnail((120, 90))
-        if thumbnail:
-            list_item.setIcon(QIcon(thumbnail))
-        else:
-            # 如果无法生成缩略图，创建默认图标
-            self._create_default_icon(list_item, media_item.media_type)
-        
-        # 设置工具提示显示完整信息
-        tooltip = f"文件: {media_item.name}\n"
-        tooltip += f"路径: {media_item.file_path}\n"
-        tooltip += f"类型: {media_item.media_type}\n"
-        if media_item.duration > 0:
-            tooltip += f"时长: {media_item.duration:.2f}秒\n"
-        if media_item.width > 0 and media_item.height > 0:
-            tooltip += f"分辨率: {media_item.width}x{media_item.height}\n"
-        if media_item.file_size > 0:
-            size_mb = media_item.file_size / (1024 * 1024)
-            tooltip += f"大小: {size_mb:.1f}MB"
-        list_item.setToolTip(tooltip)
+        list_item = self.media_list.item(media_index)
+        if list_item is None:
+            return
         
-        self.media_list.addItem(list_item)
+        # 元数据已在后台任务中读取，补全列表项文字
+        self._describe_list_item(list_item, media_item)
+        
+        if image.isNull():
+            return
+        
+        media_item.thumbnail = QPixmap.fromImage(image)
+        list_item.setIcon(QIcon(media_item.thumbnail))
+    
+    def on_preview_thumbnail_ready(self, _index: int, media_item: MediaItem, image: QImage):
+        """悬停预览缩略图生成完成，填入仍在显示的弹窗"""
+        # 弹窗可能已关闭或已切换到其他媒体
+        if self._preview_label is None or self._preview_media is not media_item:
+            return
+        
+        if image.isNull():
+            self._preview_label.setText("无法预览")
+            self._preview_label.setStyleSheet("border: 1px solid #ccc; background-color: #f0f0f0; color: #666;")
+        else:
+            self._preview_label.setPixmap(QPixmap.fromImage(image))
     
     def dropEvent(self, event: QDropEvent):
         """处理文件拖拽事件"""
@@ -1139,29 +2543,22 @@ class MediaLibraryWidget(QWidget):
         for url in event.mimeData().urls():
             file_path = url.toLocalFile()
             if os.path.isfile(file_path):
-                # 预先检查文件类型
-                temp_media_item = MediaItem(file_path)
-                if temp_media_item.is_valid_media_file():
+                # 预先按扩展名检查文件类型，MediaItem 只在真正添加时创建一次
+                if is_valid_media_path(file_path):
                     valid_files.append(file_path)
                 else:
                     invalid_files.append(os.path.basename(file_path))
         
         # 添加有效文件
-        for file_path in valid_files:
-            self.add_media_item(file_path)
+        if valid_files:
+            self.add_media_paths(valid_files)
         
         # 如果有无效文件，显示警告
         if invalid_files:
-            from PyQt6.QtWidgets import QMessageBox
-            invalid_list = "\n• ".join(invalid_files)
             QMessageBox.warning(
                 self,
                 "部分文件无法导入",
-                f"以下文件不是支持的媒体文件类型，已跳过：\n\n• {invalid_list}\n\n"
-                f"支持的格式：\n"
-                f"• 视频：mp4, avi, mov, mkv, wmv, flv, m4v, webm\n"
-                f"• 音频：mp3, wav, aac, m4a, flac, ogg\n"
-                f"• 图片：jpg, jpeg, png, bmp, gif, tiff"
+                _SKIPPED_FILES_MSG_TEMPLATE.format(invalid_list="\n• ".join(invalid_files))
             )
         
         event.acceptProposedAction()
@@ -1179,6 +2576,11 @@ class TimelineToolbar(QWidget):
     
     def __init__(self):
         super().__init__()
+        # 拖动缩放滑块时每 16ms 最多发出一次 zoomChanged，且总会发出最后的值
+        self._zoom_emit_timer = QTimer(self)
+        self._zoom_emit_timer.setSingleShot(True)
+        self._zoom_emit_timer.setInterval(16)
+        self._zoom_emit_timer.timeout.connect(self._emit_zoom)
         self.setup_ui()
     
     def setup_ui(self):
@@ -1362,8 +2764,13 @@ class TimelineToolbar(QWidget):
         # 将滑块值转换为实际百分比 (值除以10)
         actual_percentage = value / 10.0
         self.zoom_label.setText(f"{actual_percentage:.1f}%")
-        zoom_factor = actual_percentage / 100.0
-        self.zoomChanged.emit(zoom_factor)
+        # 时间轴重绘较重，合并连续的滑块变化，由定时器发出最新值
+        if not self._zoom_emit_timer.isActive():
+            self._zoom_emit_timer.start()
+    
+    def _emit_zoom(self):
+        """按滑块当前值发出缩放信号"""
+        self.zoomChanged.emit(self.zoom_slider.value() / 1000.0)
     
     def update_current_time(self, time_seconds):
         """更新当前时间显示"""
@@ -1380,6 +2787,17 @@ class TimelineToolbar(QWidget):
 class TimelineRulerWidget(QWidget):
     """固定的时间刻度条组件"""
     
+    # 刻度绘制用的字体和画笔，每次重绘复用
+    _RULER_FONT = QFont("Arial", 9)
+    _MAJOR_TICK_PEN = QPen(QColor(80, 80, 80), 2)
+    _MINOR_TICK_PEN = QPen(QColor(120, 120, 120), 1)
+    _LABEL_PEN = QPen(QColor(60, 60, 60))
+    # 播放头三角形以顶点为原点预先构建，绘制时平移到播放头位置
+    _PLAYHEAD_TRIANGLE = QPolygonF([QPointF(0, 0), QPointF(-8, 8), QPointF(8, 8)])
+    _PLAYHEAD_PEN = QPen(QColor(255, 0, 0), 3)
+    _PLAYHEAD_OUTLINE_PEN = QPen(QColor(180, 0, 0), 1)
+    _PLAYHEAD_BRUSH = QBrush(QColor(255, 0, 0))
+    
     def __init__(self):
         super().__init__()
         self.pixels_per_second = 50
@@ -1388,18 +2806,54 @@ class TimelineRulerWidget(QWidget):
         self.ruler_height = 30
         self.setFixedHeight(self.ruler_height)
         self.setStyleSheet("background-color: #f0f0f0; border-bottom: 1px solid #c0c0c0;")
+        # 刻度只随缩放、时长和宽度变化，绘制到缓存图上；播放时只需重绘播放头
+        self._ticks_pixmap: Optional[QPixmap] = None
         
     def set_timeline_params(self, pixels_per_second, timeline_duration, current_time):
         """设置时间轴参数"""
+        if (pixels_per_second != self.pixels_per_second
+                or timeline_duration != self.timeline_duration):
+            self._ticks_pixmap = None
         self.pixels_per_second = pixels_per_second
         self.timeline_duration = timeline_duration
         self.current_time = current_time
         self.update()
+    
+    def resizeEvent(self, event):
+        """宽度变化后刻度缓存失效"""
+        self._ticks_pixmap = None
+        super().resizeEvent(event)
         
     def paintEvent(self, event):
         """绘制时间刻度条"""
+        if self._ticks_pixmap is None:
+            self._ticks_pixmap = self._render_ticks()
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._ticks_pixmap)
+        
+        # 绘制播放头
+        playhead_x = self.current_time * self.pixels_per_second
+        if 0 <= playhead_x <= self.width():
+            x = int(playhead_x)
+            painter.setPen(self._PLAYHEAD_PEN)
+            painter.drawLine(x, 0, x, self.ruler_height)
+            
+            # 播放头三角形
+            painter.translate(x, 0)
+            painter.setBrush(self._PLAYHEAD_BRUSH)
+            painter.setPen(self._PLAYHEAD_OUTLINE_PEN)
+            painter.drawPolygon(self._PLAYHEAD_TRIANGLE)
+    
+    def _render_ticks(self) -> QPixmap:
+        """把背景、刻度和时间标签绘制到一张与控件等大的图上"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, int(self.width() * ratio)), max(1, int(self.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # 绘制背景
         painter.fillRect(self.rect(), QColor(240, 240, 240))
@@ -1445,6 +2899,7 @@ class TimelineRulerWidget(QWidget):
             show_frames = False
         
         # 绘制主刻度
+        painter.setFont(self._RULER_FONT)
         current_time = 0
         while current_time <= self.timeline_duration:
             x = current_time * self.pixels_per_second
@@ -1452,7 +2907,7 @@ class TimelineRulerWidget(QWidget):
                 break
                 
             # 主刻度线
-            painter.setPen(QPen(QColor(80, 80, 80), 2))
+            painter.setPen(self._MAJOR_TICK_PEN)
             painter.drawLine(int(x), 0, int(x), 20)
             
             # 时间标签
@@ -1461,50 +2916,69 @@ class TimelineRulerWidget(QWidget):
                 frame_number = int(current_time * fps)
                 time_text = f"{frame_number:04d}f"
             else:
-                # 显示时间格式
-                minutes = int(current_time) // 60
-                seconds = int(current_time) % 60
-                if current_time >= 3600:  # 超过1小时显示小时
-                    hours = int(current_time) // 3600
-                    minutes = (int(current_time) % 3600) // 60
-                    time_text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                else:
-                    time_text = f"{minutes:02d}:{seconds:02d}"
+                # 显示时间格式（超过1小时显示小时）
+                time_text = _fmt_time(int(current_time))
             
-            painter.setPen(QPen(QColor(60, 60, 60)))
-            painter.setFont(QFont("Arial", 9))
+            painter.setPen(self._LABEL_PEN)
             painter.drawText(int(x) + 3, 15, time_text)
             
             current_time += major_interval
         
         # 绘制次刻度
         if show_minor and minor_interval < major_interval:
+            painter.setPen(self._MINOR_TICK_PEN)
             current_time = 0
             while current_time <= self.timeline_duration:
                 if current_time % major_interval != 0:  # 不与主刻度重叠
                     x = current_time * self.pixels_per_second
                     if x > self.width():
                         break
-                    painter.setPen(QPen(QColor(120, 120, 120), 1))
                     painter.drawLine(int(x), 0, int(x), 10)
                 current_time += minor_interval
         
-        # 绘制播放头
-        playhead_x = self.current_time * self.pixels_per_second
-        if 0 <= playhead_x <= self.width():
-            painter.setPen(QPen(QColor(255, 0, 0), 3))
-            painter.drawLine(int(playhead_x), 0, int(playhead_x), self.ruler_height)
-            
-            # 播放头三角形
-            triangle_size = 8
-            triangle_points = [
-                QPoint(int(playhead_x), 0),
-                QPoint(int(playhead_x - triangle_size), triangle_size),
-                QPoint(int(playhead_x + triangle_size), triangle_size)
-            ]
-            painter.setBrush(QBrush(QColor(255, 0, 0)))
-            painter.setPen(QPen(QColor(180, 0, 0), 1))
-            painter.drawPolygon(triangle_points)
+        painter.end()
+        return pixmap
+
+class TracksBackgroundItem(QGraphicsItem):
+    """轨道背景：用一个场景项绘制所有交替颜色的轨道条带"""
+    
+    _BORDER_PEN = QPen(QColor(200, 200, 200))
+    _EVEN_BRUSH = QBrush(QColor(240, 240, 240))
+    _ODD_BRUSH = QBrush(QColor(250, 250, 250))
+    
+    def __init__(self, width: float, track_count: int, track_height: float):
+        super().__init__()
+        self.width = width
+        self.track_count = track_count
+        self.track_height = track_height
+        self.setZValue(-1)
+        self._build_paths()
+    
+    def _build_paths(self):
+        """奇偶轨道各合并成一条路径，重绘时只需两次 drawPath"""
+        self._even_path = QPainterPath()
+        self._odd_path = QPainterPath()
+        for i in range(self.track_count):
+            path = self._even_path if i % 2 == 0 else self._odd_path
+            path.addRect(QRectF(0, i * self.track_height, self.width, self.track_height))
+    
+    def set_width(self, width: float):
+        """缩放时间轴后调整条带宽度"""
+        if width == self.width:
+            return
+        self.prepareGeometryChange()
+        self.width = width
+        self._build_paths()
+    
+    def boundingRect(self) -> QRectF:
+        return QRectF(0, 0, self.width, self.track_count * self.track_height)
+    
+    def paint(self, painter, option, widget=None):
+        painter.setPen(self._BORDER_PEN)
+        painter.setBrush(self._EVEN_BRUSH)
+        painter.drawPath(self._even_path)
+        painter.setBrush(self._ODD_BRUSH)
+        painter.drawPath(self._odd_path)
 
 class TimelineWidget(QGraphicsView):
     was_playing_before_scrub = False # 用于记录拖动前是否在播放
@@ -1514,16 +2988,41 @@ class TimelineWidget(QGraphicsView):
     playhead_position_changed = pyqtSignal(float)  # 播放头位置变化信号
     clips_changed = pyqtSignal()  # 剪辑变化信号
     
+    # 剪辑矩形按媒体类型的填充（普通 / 选中高亮），以及边框、标签字体和颜色，每次重绘复用
+    _CLIP_BRUSHES = {
+        'video': QBrush(QColor(100, 150, 255)),
+        'audio': QBrush(QColor(100, 255, 150)),
+        'image': QBrush(QColor(255, 150, 100)),
+    }
+    _SELECTED_CLIP_BRUSHES = {
+        'video': QBrush(QColor(100, 150, 255, 200)),
+        'audio': QBrush(QColor(100, 255, 150, 200)),
+        'image': QBrush(QColor(255, 150, 100, 200)),
+    }
+    _CLIP_PEN = QPen(QColor(50, 50, 50))
+    _SELECTED_CLIP_PEN = QPen(QColor(255, 255, 0), 3)  # 黄色边框表示选中
+    _CLIP_FONT = QFont("Arial", 9)
+    _CLIP_LABEL_COLOR = QColor(255, 255, 255)
+    
     def __init__(self):
         super().__init__()
         self.scene = QGraphicsScene()
         self.setScene(self.scene)
         
         self.clips: List[TimelineClip] = []
+        self._clip_count = 0  # 剪辑数量缓存，随增删同步更新
+        self._clip_index: Optional[ClipIntervalIndex] = None  # 剪辑增删或改变时长后置空，按需重建
         self.tracks = 5  # 默认5个轨道
         self.track_height = 60
         self.base_pixels_per_second = 50  # 基础缩放比例
         self.pixels_per_second = 50
+        # 场景坐标换算用的倒数，鼠标和拖拽事件中用乘法代替除法，缩放时更新
+        self._inv_pps = 1.0 / self.pixels_per_second
+        self._inv_track_h = 1.0 / self.track_height
+        # 视口左边缘对应的场景 X 坐标，滚动、改变大小或场景范围变化时更新；
+        # 拖动播放头时由它直接换算时间，不必每个事件调用 mapToScene
+        self._view_origin_x = 0.0
+        self.scene.sceneRectChanged.connect(self._update_view_origin)
         self.zoom_factor = 1.0  # 缩放因子
         self.timeline_duration = 300  # 默认5分钟，会根据内容动态调整
         self.total_duration = 300  # 实际总时长，用于播放头拖动边界检查
@@ -1531,15 +3030,27 @@ class TimelineWidget(QGraphicsView):
         
         # 拖拽状态管理
         self.is_dragging = False
-        self.last_preview_pos = None
-        self.preview_items = []  # 跟踪预览项
-        
-        # 播放头
+        self.last_preview_pos = None  # 上次预览的场景 X 坐标
+        self._last_preview_track = None
+        self._drag_preview_duration = None  # 本次拖拽媒体的时长，MIME 数据在一次拖拽中不变
+        # 拖拽预览矩形和标签放在同一个常驻组中，作为一个场景项整体显示、隐藏和移出场景
+        self._preview_group = None
+        self._preview_rect = None
+        self._preview_text = None
+        
+        # 播放头（线条、拖动区域和拖动时的时间标签常驻场景，移动时只更新几何）
         self.playhead = None
+        self.playhead_drag_area = None
+        self.playhead_time_label = None
+        self.playhead_time_bg = None
+        self._playhead_x = None  # 上次绘制时播放头的场景 X 坐标
+        self._playhead_height = None  # 播放头线条几何对应的场景高度
         
         # 剪辑选择和编辑
         self.selected_clips = []  # 选中的剪辑
         self.clip_graphics = {}  # 剪辑对象到图形项的映射
+        self._item_to_clip = {}  # 图形项（矩形和标签）到剪辑对象的反向映射，用于点击命中
+        self._tracks_background = None  # 轨道背景场景项，缩放时原地调整宽度
         
         # 时间范围选择（用于分段剪辑）
         self.selection_start_time = None
@@ -1554,6 +3065,15 @@ class TimelineWidget(QGraphicsView):
         self.playhead_interaction_mode = None  # 播放头交互模式：'jump' 或 'drag'
         self.drag_start_pos = None  # 拖动开始位置
         self.drag_start_time = None  # 拖动开始时间
+        # 拖动播放头时预览最多每 80ms 跳转一次：首次立即跳转，期间的位置只保留最新值，
+        # 定时器到期或松开鼠标时再跳转到该位置
+        self._pending_scrub_time = None
+        self._scrub_timer = QTimer(self)
+        self._scrub_timer.setSingleShot(True)
+        self._scrub_timer.setInterval(80)
+        self._scrub_timer.timeout.connect(self._flush_scrub_sync)
+        # 上次同步到预览的时间，同一位置不重复跳转；位置由播放器更新后清空
+        self._last_synced_time = None
         
         # 注册到播放头控制器
         if PLAYHEAD_CONTROLLER_AVAILABLE and playhead_controller:
@@ -1580,6 +3100,13 @@ class TimelineWidget(QGraphicsView):
         self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
         
+        # 拖拽预览时会频繁增删场景项，整体重绘视口比逐项计算脏区域更快
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+        
+        # 时间轴场景项经常整体重建，不维护 BSP 索引，避免每次添加都更新索引
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        
         # 设置场景大小，不包含时间标尺区域（时间标尺现在是独立组件）
         scene_width = self.timeline_duration * self.pixels_per_second
         scene_height = self.tracks * self.track_height
@@ -1593,18 +3120,13 @@ class TimelineWidget(QGraphicsView):
     
     def draw_tracks(self):
         """绘制轨道背景"""
+        # 所有轨道条带由一个场景项绘制
+        self._tracks_background = TracksBackgroundItem(self.scene.width(), self.tracks, self.track_height)
+        self.scene.addItem(self._tracks_background)
+        
         for i in range(self.tracks):
             y = i * self.track_height
             
-            # 轨道背景
-            track_rect = QGraphicsRectItem(0, y, self.scene.width(), self.track_height)
-            if i % 2 == 0:
-                track_rect.setBrush(QBrush(QColor(240, 240, 240)))
-            else:
-                track_rect.setBrush(QBrush(QColor(250, 250, 250)))
-            track_rect.setPen(QPen(QColor(200, 200, 200)))
-            self.scene.addItem(track_rect)
-            
             # 轨道标签
             label = self.scene.addText(f"轨道 {i+1}", QFont("Arial", 10))
             label.setPos(5, y + 5)
@@ -1614,109 +3136,96 @@ class TimelineWidget(QGraphicsView):
     def draw_playhead(self):
         """绘制播放头"""
         try:
-            # 清除所有播放头相关的图形元素
-            self.clear_playhead_graphics()
-            
-            # 重新绘制播放头
             x = self.current_time * self.pixels_per_second
-            
-            # 播放头线条（从轨道顶部开始）
-            self.playhead = self.scene.addLine(
-                x, 0, x, self.scene.height(),
-                QPen(QColor(255, 0, 0), 3)  # 红色播放头，加粗便于拖动
-            )
-            self.playhead.setZValue(15)  # 确保播放头在最上层
-            self.playhead.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, False)  # 禁用默认拖动，使用自定义拖动逻辑
+            scene_height = self.scene.height()
+            
+            if self.playhead is None:
+                self._create_playhead_items()
+            if self.playhead.scene() != self.scene:
+                for item in self._playhead_items():
+                    self.scene.addItem(item)
+            
+            # 线条和拖动区域的几何以 x=0 为基准，只在场景高度变化时重设
+            if scene_height != self._playhead_height:
+                # 播放头线条（从轨道顶部开始）
+                self.playhead.setLine(0, 0, 0, scene_height)
+                # 更大的不可见拖动区域，增加拖动的响应范围
+                self.playhead_drag_area.setRect(-15, -45, 30, scene_height + 50)
+                self._playhead_height = scene_height
+            self._move_playhead(x)
             
             # 播放头三角形现在在固定的时间刻度条中显示，这里不再绘制
             
-            # 添加播放头时间显示
-            if hasattr(self, 'playhead_dragging') and self.playhead_dragging:
+            # 拖动播放头时显示时间标签，只更新文字和位置
+            if self.playhead_dragging:
                 time_minutes = int(self.current_time) // 60
                 time_seconds = int(self.current_time) % 60
-                time_text = f"{time_minutes:02d}:{time_seconds:02d}"
-                self.playhead_time_label = self.scene.addText(time_text, QFont("Arial", 10, QFont.Weight.Bold))
+                self.playhead_time_label.setPlainText(f"{time_minutes:02d}:{time_seconds:02d}")
                 self.playhead_time_label.setPos(x - 20, -55)
-                self.playhead_time_label.setDefaultTextColor(QColor(255, 255, 255))
-                self.playhead_time_label.setZValue(20)
                 
-                # 添加时间标签背景
                 label_rect = self.playhead_time_label.boundingRect()
-                self.playhead_time_bg = QGraphicsRectItem(label_rect.x() - 3, label_rect.y() - 2, 
-                                          label_rect.width() + 6, label_rect.height() + 4)
-                self.playhead_time_bg.setBrush(QBrush(QColor(0, 0, 0, 180)))
-                self.playhead_time_bg.setPen(QPen(QColor(0, 0, 0, 0)))
+                self.playhead_time_bg.setRect(label_rect.x() - 3, label_rect.y() - 2,
+                                              label_rect.width() + 6, label_rect.height() + 4)
                 self.playhead_time_bg.setPos(x - 20, -55)
-                self.playhead_time_bg.setZValue(19)
-                self.scene.addItem(self.playhead_time_bg)
-            
-            # 创建一个更大的不可见拖动区域，增加拖动的响应范围
-            self.playhead_drag_area = QGraphicsRectItem(x - 15, -45, 30, self.scene.height() + 50)
-            self.playhead_drag_area.setBrush(QBrush(QColor(0, 0, 0, 0)))  # 完全透明
-            self.playhead_drag_area.setPen(QPen(QColor(0, 0, 0, 0)))  # 无边框
-            self.playhead_drag_area.setZValue(16)  # 在播放头之上
-            self.playhead_drag_area.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)  # 可选择
-            self.playhead_drag_area.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, False)  # 禁用默认拖动，使用自定义拖动逻辑
-            self.playhead_drag_area.setCursor(Qt.CursorShape.OpenHandCursor)  # 设置手型光标提示可拖动
-            self.scene.addItem(self.playhead_drag_area)
+            self.playhead_time_label.setVisible(self.playhead_dragging)
+            self.playhead_time_bg.setVisible(self.playhead_dragging)
             
         except Exception as e:
             print(f"[ERROR] 绘制播放头时出错: {e}")
-            import traceback
             traceback.print_exc()
+    
+    def _move_playhead(self, x: float):
+        """平移播放头线条和拖动区域到场景 X 坐标 x"""
+        self.playhead.setX(x)
+        self.playhead_drag_area.setX(x)
+        self._playhead_x = x
+    
+    def _create_playhead_items(self):
+        """创建常驻的播放头线条和拖动区域（尚未加入场景）"""
+        self.playhead = QGraphicsLineItem()
+        self.playhead.setPen(QPen(QColor(255, 0, 0), 3))  # 红色播放头，加粗便于拖动
+        self.playhead.setZValue(15)  # 确保播放头在最上层
+        self.playhead.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, False)  # 禁用默认拖动，使用自定义拖动逻辑
+        
+        self.playhead_drag_area = QGraphicsRectItem()
+        self.playhead_drag_area.setBrush(QBrush(QColor(0, 0, 0, 0)))  # 完全透明
+        self.playhead_drag_area.setPen(QPen(QColor(0, 0, 0, 0)))  # 无边框
+        self.playhead_drag_area.setZValue(16)  # 在播放头之上
+        self.playhead_drag_area.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)  # 可选择
+        self.playhead_drag_area.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, False)  # 禁用默认拖动，使用自定义拖动逻辑
+        self.playhead_drag_area.setCursor(Qt.CursorShape.OpenHandCursor)  # 设置手型光标提示可拖动
+        
+        # 拖动播放头时显示的时间标签及其背景，平时隐藏
+        self.playhead_time_label = QGraphicsTextItem()
+        self.playhead_time_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        self.playhead_time_label.setDefaultTextColor(QColor(255, 255, 255))
+        self.playhead_time_label.setZValue(20)
+        self.playhead_time_label.setVisible(False)
+        
+        self.playhead_time_bg = QGraphicsRectItem()
+        self.playhead_time_bg.setBrush(QBrush(QColor(0, 0, 0, 180)))
+        self.playhead_time_bg.setPen(QPen(QColor(0, 0, 0, 0)))
+        self.playhead_time_bg.setZValue(19)
+        self.playhead_time_bg.setVisible(False)
+    
+    def _playhead_items(self):
+        """播放头的全部常驻图形项"""
+        return (self.playhead, self.playhead_drag_area, self.playhead_time_label, self.playhead_time_bg)
         
     def clear_playhead_graphics(self):
-        """清除所有播放头相关的图形元素"""
-        try:
-            # 清除播放头线条
-            if hasattr(self, 'playhead') and self.playhead:
-                try:
-                    if self.playhead.scene() == self.scene:
-                        self.scene.removeItem(self.playhead)
-                except (RuntimeError, AttributeError):
-                    pass
-                self.playhead = None
-            
-            # 清除播放头三角形
-            if hasattr(self, 'playhead_triangle') and self.playhead_triangle:
-                try:
-                    if self.playhead_triangle.scene() == self.scene:
-                        self.scene.removeItem(self.playhead_triangle)
-                except (RuntimeError, AttributeError):
-                    pass
-                self.playhead_triangle = None
-            
-            # 清除拖动区域
-            if hasattr(self, 'playhead_drag_area') and self.playhead_drag_area:
-                try:
-                    if self.playhead_drag_area.scene() == self.scene:
-                        self.scene.removeItem(self.playhead_drag_area)
-                except (RuntimeError, AttributeError):
-                    pass
-                self.playhead_drag_area = None
-            
-            # 清除时间标签
-            if hasattr(self, 'playhead_time_label') and self.playhead_time_label:
-                try:
-                    if self.playhead_time_label.scene() == self.scene:
-                        self.scene.removeItem(self.playhead_time_label)
-                except (RuntimeError, AttributeError):
-                    pass
-                self.playhead_time_label = None
-            
-            # 清除时间标签背景
-            if hasattr(self, 'playhead_time_bg') and self.playhead_time_bg:
-                try:
-                    if self.playhead_time_bg.scene() == self.scene:
-                        self.scene.removeItem(self.playhead_time_bg)
-                except (RuntimeError, AttributeError):
-                    pass
-                self.playhead_time_bg = None
-                
-        except Exception as e:
-            print(f"[ERROR] 清除播放头图形时出错: {e}")
-            import traceback
-            traceback.print_exc()
+        """将播放头相关的图形元素移出场景（图形项保留以便复用）"""
+        if self.playhead is None:
+            return
+        # 移出场景后 scene.clear() 不会再销毁它们
+        for item in self._playhead_items():
+            if item.scene() == self.scene:
+                self.scene.removeItem(item)
+    
+    def hide_playhead_label(self):
+        """隐藏拖动播放头时显示的时间标签"""
+        if self.playhead_time_label is not None:
+            self.playhead_time_label.setVisible(False)
+            self.playhead_time_bg.setVisible(False)
     
     def draw_range_selection(self):
         """绘制时间范围选择矩形"""
@@ -1755,8 +3264,17 @@ class TimelineWidget(QGraphicsView):
             scrub (bool): 是否是拖动预览状态. True表示是，此时会定位播放器但不播放.
         """
         self.current_time = max(0, min(time_seconds, self.timeline_duration))
-        self.draw_playhead()
+        # 位移不足 1 像素且无需刷新时间标签时，不必更新图形项
+        new_x = self.current_time * self.pixels_per_second
+        if (self._playhead_x is None or abs(new_x - self._playhead_x) >= 1
+                or self.playhead_dragging or self.playhead.scene() != self.scene):
+            self.draw_playhead()
 
+        # 位置来自播放器等外部来源，预览可能已不在上次同步的位置
+        self._last_synced_time = None
+        # 播放头控制器只在位置变化时跳转，记下外部来源的位置，之后点回原处也会跳转
+        if PLAYHEAD_CONTROLLER_AVAILABLE and playhead_controller:
+            playhead_controller.current_time = self.current_time
         # 发射播放头位置变化信号
         self.playhead_position_changed.emit(self.current_time)
 
@@ -1774,12 +3292,7 @@ class TimelineWidget(QGraphicsView):
     
     def get_main_window(self):
         """获取主窗口引用"""
-        parent = self.parent()
-        while parent:
-            if isinstance(parent, QMainWindow):
-                return parent
-            parent = parent.parent()
-        return None
+        return MainWindow.instance()
 
     def mousePressEvent(self, event):
         """重构的鼠标按下事件，区分点击和拖动意图"""
@@ -1798,9 +3311,10 @@ class TimelineWidget(QGraphicsView):
                                      playhead_click_tolerance * 2, self.scene.height() + 75)
                 
                 is_on_playhead = playhead_area.contains(scene_pos)
-                is_on_clip = isinstance(item, QGraphicsRectItem)
+                # 剪辑矩形和标签都算点中剪辑；播放头优先于其下方的剪辑
+                clicked_clip = None if is_on_playhead else self._item_to_clip.get(item)
                 
-                print(f"[DEBUG] 鼠标点击检测: 场景位置=({scene_pos.x():.1f}, {scene_pos.y():.1f}), 播放头X={playhead_x:.1f}, 在播放头上={is_on_playhead}, 在剪辑上={is_on_clip}")
+                print(f"[DEBUG] 鼠标点击检测: 场景位置=({scene_pos.x():.1f}, {scene_pos.y():.1f}), 播放头X={playhead_x:.1f}, 在播放头上={is_on_playhead}, 在剪辑上={clicked_clip is not None}")
                 if is_on_playhead:
                     print(f"[DEBUG] *** 检测到播放头点击，准备进入拖动模式 ***")
 
@@ -1812,9 +3326,32 @@ class TimelineWidget(QGraphicsView):
                     return
                 
                 else:
+                    # 清除之前的范围选择
+                    self.clear_range_selection()
+                    is_ctrl_pressed = event.modifiers() & Qt.KeyboardModifier.ControlModifier
+                    
+                    if clicked_clip is not None:
+                        # 处理剪辑选择：Ctrl+点击切换选择状态，普通点击只选中该剪辑
+                        if is_ctrl_pressed:
+                            if clicked_clip in self.selected_clips:
+                                selected = [c for c in self.selected_clips if c is not clicked_clip]
+                            else:
+                                selected = self.selected_clips + [clicked_clip]
+                        else:
+                            selected = [clicked_clip]
+                        
+                        self.set_selected_clips(selected)
+                        print(f"选中剪辑: {clicked_clip.media_item.name}")
+                        super().mousePressEvent(event) # 允许父类处理拖动
+                        return
+                    
                     # 计算时间位置
-                    new_time = scene_pos.x() / self.pixels_per_second
-                    new_time = max(0, min(new_time, self.total_duration))
+                    new_time = scene_pos.x() * self._inv_pps
+                    new_time = max(0, min(new_time, self.timeline_duration))
+                    
+                    # 点击空白区域时，如果没有按Ctrl，取消所有选择
+                    if not is_on_playhead and not is_ctrl_pressed:
+                        self.set_selected_clips([])
                     
                     # 使用播放头控制器处理交互
                     if PLAYHEAD_CONTROLLER_AVAILABLE and playhead_controller:
@@ -1830,34 +3367,16 @@ class TimelineWidget(QGraphicsView):
                         self.playhead_dragging = False
                         self.set_current_time(new_time)
                         print(f"[DEBUG] 播放头点击（兼容模式），时间: {new_time:.2f}s")
-                        event.accept()
-                        return
-                    elif not is_on_clip:
+                    else:
                         self.set_current_time(new_time)
                         print(f"[DEBUG] 时间轴点击（兼容模式），跳转到: {new_time:.2f}s")
-                        event.accept()
-                        return
-                    elif is_on_clip:
-                        # 处理剪辑选择
-                        for clip, graphics in self.clip_graphics.items():
-                            if graphics['rect'] == item:
-                                if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
-                                    if clip in self.selected_clips:
-                                        self.selected_clips.remove(clip)
-                                    else:
-                                        self.selected_clips.append(clip)
-                                else:
-                                    self.selected_clips = [clip]
-                                
-                                self.redraw_timeline()
-                                super().mousePressEvent(event) # 允许父类处理拖动
-                                return
+                    event.accept()
+                    return
 
             super().mousePressEvent(event)
             
         except Exception as e:
             print(f"[ERROR] 鼠标按下事件处理失败: {e}")
-            import traceback
             traceback.print_exc()
             # 确保父类事件仍然被处理
             try:
@@ -1871,15 +3390,50 @@ class TimelineWidget(QGraphicsView):
         """设置当前时间并同步所有相关组件"""
         self.current_time = new_time
         self.draw_playhead()
-        self.sync_video_preview(new_time)
+        if self.playhead_interaction_mode == 'drag':
+            self._queue_scrub_sync(new_time)
+        else:
+            self.sync_video_preview(new_time)
         self.playhead_position_changed.emit(new_time)
     
+    def _queue_scrub_sync(self, new_time):
+        """拖动中的预览同步：空闲时立即跳转，否则只记下最新位置等定时器到期"""
+        if self._scrub_timer.isActive():
+            self._pending_scrub_time = new_time
+            return
+        self._pending_scrub_time = None
+        self.sync_video_preview(new_time)
+        self._scrub_timer.start()
+    
+    def _flush_scrub_sync(self):
+        """跳转到拖动期间记下的最新位置"""
+        self._scrub_timer.stop()
+        if self._pending_scrub_time is not None:
+            new_time = self._pending_scrub_time
+            self._pending_scrub_time = None
+            self.sync_video_preview(new_time)
+            self._scrub_timer.start()
+    
+    def is_dragging_playhead(self) -> bool:
+        """是否正在拖动播放头（兼容模式或播放头控制器）"""
+        if self.playhead_interaction_mode == 'drag':
+            return True
+        return bool(PLAYHEAD_CONTROLLER_AVAILABLE and playhead_controller
+                    and playhead_controller.is_scrubbing)
+    
     def on_playhead_controller_position_changed(self, new_time):
         """播放头控制器位置变化回调"""
+        # 控制器既直接回调又通过 position_changed 信号通知，同一位置只处理一次
+        if new_time == self.current_time and self._playhead_x is not None:
+            return
         self.current_time = new_time
         self.draw_playhead()
-        self.sync_video_preview(new_time)
-        # 不需要再次发射信号，避免循环
+        if self.is_dragging_playhead():
+            self._queue_scrub_sync(new_time)
+        else:
+            self.sync_video_preview(new_time)
+        # 刻度条和工具栏跟随播放头；拖动中主窗口不再另行跳转预览
+        self.playhead_position_changed.emit(new_time)
 
     def start_playhead_drag(self, scene_pos):
         """开始播放头拖动的辅助函数"""
@@ -1902,6 +3456,9 @@ class TimelineWidget(QGraphicsView):
     def finish_playhead_drag(self):
         """完成播放头拖动的辅助函数"""
         print("[DEBUG] 结束拖拽时间滑块")
+        # 确保最后的拖动位置一定会跳转
+        self._flush_scrub_sync()
+        self._scrub_timer.stop()
         try:
             main_window = self.get_main_window()
             if main_window and self.was_playing_before_scrub:
@@ -1911,7 +3468,10 @@ class TimelineWidget(QGraphicsView):
         self.was_playing_before_scrub = False
 
     def sync_video_preview(self, new_time):
-        """同步视频预览的辅助函数"""
+        """同步视频预览的辅助函数，与上次同步的时间相同时不再跳转"""
+        if new_time == self._last_synced_time:
+            return
+        self._last_synced_time = new_time
         try:
             main_window = self.get_main_window()
             if main_window and hasattr(main_window, 'video_preview'):
@@ -1924,21 +3484,35 @@ class TimelineWidget(QGraphicsView):
         except Exception as e:
             print(f"[WARNING] 视频预览同步失败: {e}")
 
+    def _update_view_origin(self, *args):
+        """重新计算视口左边缘对应的场景 X 坐标"""
+        self._view_origin_x = self.mapToScene(0, 0).x()
+    
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        if dx:
+            self._update_view_origin()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # 场景比视口窄时居中显示，视口宽度变化会改变场景的起点
+        self._update_view_origin()
+
     def mouseMoveEvent(self, event):
         """重构的鼠标移动事件，处理拖动状态转换"""
         try:
-            scene_pos = self.mapToScene(event.pos())
+            # 时间只与场景 X 坐标有关，用缓存的视口偏移换算
+            new_time = (event.position().x() + self._view_origin_x) * self._inv_pps
+            new_time = max(0, min(new_time, self.timeline_duration))
 
             # 如果正在范围选择，则更新范围
             if self.is_selecting_range:
-                self.update_range_selection(scene_pos)
+                self.update_range_selection(self.mapToScene(event.pos()))
                 event.accept()
                 return
 
             # 使用播放头控制器处理拖动
             if PLAYHEAD_CONTROLLER_AVAILABLE and playhead_controller:
-                new_time = scene_pos.x() / self.pixels_per_second
-                new_time = max(0, min(new_time, self.total_duration))
                 if playhead_controller.handle_drag(new_time):
                     event.accept()
                     return
@@ -1947,6 +3521,7 @@ class TimelineWidget(QGraphicsView):
             if self.is_scrubbing:
                 # 检查是否从'jump'模式切换到'drag'模式
                 if self.playhead_interaction_mode == 'jump':
+                    scene_pos = self.mapToScene(event.pos())
                     distance = (scene_pos - self.drag_start_pos).manhattanLength()
                     if distance > 5:  # 移动超过阈值才认为是拖动
                         self.playhead_interaction_mode = 'drag'
@@ -1955,9 +3530,6 @@ class TimelineWidget(QGraphicsView):
                 
                 # 如果是拖动模式，则更新播放头
                 if self.playhead_interaction_mode == 'drag':
-                    new_time = scene_pos.x() / self.pixels_per_second
-                    new_time = max(0, min(new_time, self.total_duration))
-                    
                     if abs(new_time - self.current_time) > 0.001:
                         self.set_current_time(new_time)
                 
@@ -1968,7 +3540,6 @@ class TimelineWidget(QGraphicsView):
             
         except Exception as e:
             print(f"[ERROR] 鼠标移动事件处理失败: {e}")
-            import traceback
             traceback.print_exc()
             try:
                 super().mouseMoveEvent(event)
@@ -1979,9 +3550,20 @@ class TimelineWidget(QGraphicsView):
         try:
             scene_pos = self.mapToScene(event.pos())
 
+            # 1. 完成范围选择
+            if self.is_selecting_range:
+                self.finish_range_selection(scene_pos)
+                event.accept()
+                return
+
             # 使用播放头控制器处理释放事件
             if PLAYHEAD_CONTROLLER_AVAILABLE and playhead_controller:
+                was_dragging = playhead_controller.is_scrubbing
                 playhead_controller.handle_drag_end()
+                if was_dragging:
+                    # 确保最后的拖动位置一定会跳转
+                    self._flush_scrub_sync()
+                    self._scrub_timer.stop()
                 event.accept()
                 return
             
@@ -1994,6 +3576,7 @@ class TimelineWidget(QGraphicsView):
                 # 重置所有相关状态
                 self.is_scrubbing = False
                 self.playhead_dragging = False
+                self.hide_playhead_label()
                 self.playhead_interaction_mode = None
                 self.drag_start_pos = None
                 self.setCursor(Qt.CursorShape.ArrowCursor)
@@ -2002,17 +3585,10 @@ class TimelineWidget(QGraphicsView):
                 event.accept()
                 return
 
-            # 2. 完成范围选择
-            if self.is_selecting_range:
-                self.finish_range_selection(scene_pos)
-                event.accept()
-                return
-
             super().mouseReleaseEvent(event)
             
         except Exception as e:
             print(f"[ERROR] 鼠标释放事件处理失败: {e}")
-            import traceback
             traceback.print_exc()
             # 确保父类事件仍然被处理
             try:
@@ -2024,7 +3600,7 @@ class TimelineWidget(QGraphicsView):
         """开始范围选择"""
         self.is_selecting_range = True
         self.range_selection_start_pos = scene_pos
-        self.selection_start_time = max(0, scene_pos.x() / self.pixels_per_second)
+        self.selection_start_time = max(0, scene_pos.x() * self._inv_pps)
         print(f"[DEBUG] 开始范围选择，起始时间: {self.selection_start_time:.2f}s")
     
     def update_range_selection(self, scene_pos):
@@ -2036,8 +3612,8 @@ class TimelineWidget(QGraphicsView):
         start_x = min(self.range_selection_start_pos.x(), scene_pos.x())
         end_x = max(self.range_selection_start_pos.x(), scene_pos.x())
         
-        start_time = max(0, start_x / self.pixels_per_second)
-        end_time = min(self.timeline_duration, end_x / self.pixels_per_second)
+        start_time = max(0, start_x * self._inv_pps)
+        end_time = min(self.timeline_duration, end_x * self._inv_pps)
         
         # 更新选择时间
         self.selection_start_time = start_time
@@ -2129,29 +3705,24 @@ class TimelineWidget(QGraphicsView):
         new_clip.out_point = new_clip.in_point + new_clip_duration
 
         # 3. 修改第一个剪辑（分割后的左半部分）
-        clip.duration = split_point_in_clip
-        clip.out_point = clip.in_point + clip.duration
+        clip.resize(split_point_in_clip)
 
         # 4. 将新剪辑添加到时间轴
         self.clips.append(new_clip)
+        self._clip_count += 1
+        self._clip_index = None
+        self.clips_changed.emit()
 
         # 5. 重新绘制时间轴
         self.redraw_timeline()
         print(f"Clip '{clip.media_item.name}' split at {split_time:.2f}s.")
     
-    def get_main_window(self):
-        """获取主窗口引用"""
-        widget = self
-        while widget.parent():
-            widget = widget.parent()
-            if isinstance(widget, MainWindow):
-                return widget
-        return None
-    
     def add_clip(self, media_item: MediaItem, track: int, start_time: float):
         """添加剪辑到时间轴"""
         clip = TimelineClip(media_item, track, start_time, media_item.duration)
         self.clips.append(clip)
+        self._clip_count += 1
+        self._clip_index = None
         
         # 更新时间轴总时长
         self.update_timeline_duration()
@@ -2166,16 +3737,7 @@ class TimelineWidget(QGraphicsView):
         height = self.track_height - 4
         
         clip_rect = QGraphicsRectItem(x, y + 2, width, height)
-        
-        # 根据媒体类型设置颜色
-        if media_item.media_type == 'video':
-            clip_rect.setBrush(QBrush(QColor(100, 150, 255)))
-        elif media_item.media_type == 'audio':
-            clip_rect.setBrush(QBrush(QColor(100, 255, 150)))
-        else:
-            clip_rect.setBrush(QBrush(QColor(255, 150, 100)))
-        
-        clip_rect.setPen(QPen(QColor(50, 50, 50)))
+        self._style_clip_rect(clip_rect, clip, False)
         
         # 设置可选择
         clip_rect.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
@@ -2184,43 +3746,103 @@ class TimelineWidget(QGraphicsView):
         self.scene.addItem(clip_rect)
         
         # 添加剪辑标签
-        label = self.scene.addText(media_item.name, QFont("Arial", 9))
+        label = self.scene.addText(media_item.name, self._CLIP_FONT)
         label.setPos(x + 5, y + 5)
-        label.setDefaultTextColor(QColor(255, 255, 255))
+        label.setDefaultTextColor(self._CLIP_LABEL_COLOR)
+        label.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         
         # 存储剪辑到图形项的映射
         self.clip_graphics[clip] = {'rect': clip_rect, 'label': label}
+        self._item_to_clip[clip_rect] = clip
+        self._item_to_clip[label] = clip
         
         print(f"添加剪辑: {media_item.name} 到轨道 {track}, 开始时间 {start_time:.2f}s")
         print(f"时间轴总时长更新为: {self.timeline_duration:.2f}s")
     
+    def add_clips_batch(self, media_items: List[MediaItem], track: int, start_time: float):
+        """批量添加剪辑，从 start_time 起在同一轨道上首尾相接排列
+        
+        与逐个调用 add_clip 不同，只发射一次 clips_changed 并只重绘一次时间轴。
+        """
+        for media_item in media_items:
+            clip = TimelineClip(media_item, track, start_time, media_item.duration)
+            self.clips.append(clip)
+            start_time += clip.duration
+        self._clip_count += len(media_items)
+        self._clip_index = None
+        
+        self.update_timeline_duration()
+        self.clips_changed.emit()
+        
+        self.setUpdatesEnabled(False)
+        try:
+            self.redraw_timeline()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def clips_at(self, time_seconds: float) -> List[TimelineClip]:
+        """返回覆盖指定时刻的剪辑（二分查找区间索引）"""
+        if self._clip_index is None:
+            self._clip_index = ClipIntervalIndex(self.clips)
+        return self._clip_index.clips_at(time_seconds)
+    
     def update_timeline_duration(self):
         """根据剪辑动态更新时间轴总时长"""
         if not self.clips:
             # 如果没有剪辑，保持最小时长
             self.timeline_duration = max(300, self.total_duration)
-            return
-        
-        # 计算所有剪辑的最大结束时间
-        max_end_time = max(clip.end_time for clip in self.clips)
-        
-        # 设置时间轴总时长为剪辑最大结束时间的1.2倍，确保有足够的空间
-        self.timeline_duration = max(max_end_time * 1.2, self.total_duration, 300)
+        else:
+            # 计算所有剪辑的最大结束时间
+            max_end_time = max(clip.end_time for clip in self.clips)
+            
+            # 设置时间轴总时长为剪辑最大结束时间的1.2倍，确保有足够的空间
+            self.timeline_duration = max(max_end_time * 1.2, self.total_duration, 300)
+            
+            print(f"时间轴总时长更新: 剪辑最大结束时间 {max_end_time:.2f}s, 时间轴总时长 {self.timeline_duration:.2f}s")
         
-        print(f"时间轴总时长更新: 剪辑最大结束时间 {max_end_time:.2f}s, 时间轴总时长 {self.timeline_duration:.2f}s")
+        # 播放头控制器按总时长限制跳转位置
+        if PLAYHEAD_CONTROLLER_AVAILABLE and playhead_controller:
+            playhead_controller.set_duration(self.timeline_duration)
     
     def apply_zoom(self, zoom_factor: float):
         """应用缩放"""
         self.zoom_factor = zoom_factor
         self.pixels_per_second = self.base_pixels_per_second * zoom_factor
+        self._inv_pps = 1.0 / self.pixels_per_second
         
-        # 重新绘制整个时间轴
-        self.redraw_timeline()
+        # 缩放只改变横向坐标，已有图形项与剪辑一一对应时原地更新几何，不清空重建场景
+        if self._tracks_background is None or len(self.clip_graphics) != len(self.clips):
+            self.redraw_timeline()
+        else:
+            self._relayout_horizontal()
+    
+    def _relayout_horizontal(self):
+        """按当前 pixels_per_second 更新场景宽度和各图形项的横向位置"""
+        scene_width = self.timeline_duration * self.pixels_per_second
+        ruler_height = 30
+        self.scene.setSceneRect(0, -ruler_height, scene_width, self.tracks * self.track_height + ruler_height)
+        self._tracks_background.set_width(scene_width)
+        
+        for clip, graphics in self.clip_graphics.items():
+            x = clip.start_time * self.pixels_per_second
+            y = clip.track * self.track_height
+            clip_rect = graphics['rect']
+            # 拖动过的矩形带有位移，归零后按剪辑时间重新定位
+            clip_rect.setPos(0, 0)
+            clip_rect.setRect(x, y + 2, clip.duration * self.pixels_per_second, self.track_height - 4)
+            graphics['label'].setPos(x + 5, y + 5)
+        
+        self.draw_range_selection()
+        self.draw_playhead()
+        
+        # 通知主窗口更新固定时间刻度条
+        if hasattr(self.parent(), 'timeline_ruler'):
+            self.parent().timeline_ruler.update()
     
     def redraw_timeline(self):
         """重新绘制时间轴"""
-        # 清除场景前先清理预览项
-        self.preview_items.clear()
+        # 清除场景前先移出预览项，以便 scene.clear() 后继续复用
+        self._detach_drop_preview()
         
         # 清除所有播放头相关的图形元素
         self.clear_playhead_graphics()
@@ -2231,6 +3853,7 @@ class TimelineWidget(QGraphicsView):
         # 清除场景
         self.scene.clear()
         self.clip_graphics.clear()
+        self._item_to_clip.clear()
         
         # 重新设置场景大小，包含时间标尺区域
         scene_width = self.timeline_duration * self.pixels_per_second
@@ -2267,23 +3890,7 @@ class TimelineWidget(QGraphicsView):
         height = self.track_height - 4
         
         clip_rect = QGraphicsRectItem(x, y + 2, width, height)
-        
-        # 根据媒体类型设置颜色
-        if clip.media_item.media_type == 'video':
-            base_color = QColor(100, 150, 255)
-        elif clip.media_item.media_type == 'audio':
-            base_color = QColor(100, 255, 150)
-        else:
-            base_color = QColor(255, 150, 100)
-        
-        # 如果剪辑被选中，使用高亮颜色
-        if clip in self.selected_clips:
-            highlight_color = QColor(base_color.red(), base_color.green(), base_color.blue(), 200)
-            clip_rect.setBrush(QBrush(highlight_color))
-            clip_rect.setPen(QPen(QColor(255, 255, 0), 3))  # 黄色边框表示选中
-        else:
-            clip_rect.setBrush(QBrush(base_color))
-            clip_rect.setPen(QPen(QColor(50, 50, 50)))
+        self._style_clip_rect(clip_rect, clip, clip in self.selected_clips)
         
         # 设置可选择和可移动
         clip_rect.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
@@ -2292,23 +3899,46 @@ class TimelineWidget(QGraphicsView):
         self.scene.addItem(clip_rect)
         
         # 添加剪辑标签
-        label = self.scene.addText(clip.media_item.name, QFont("Arial", 9))
+        label = self.scene.addText(clip.media_item.name, self._CLIP_FONT)
         label.setPos(x + 5, y + 5)
-        label.setDefaultTextColor(QColor(255, 255, 255))
+        label.setDefaultTextColor(self._CLIP_LABEL_COLOR)
+        # 文字排版代价较高，缓存为像素图；剪辑矩形本身绘制很便宜且可能极宽，不做缓存
+        label.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         
         # 存储映射
         self.clip_graphics[clip] = {'rect': clip_rect, 'label': label}
+        self._item_to_clip[clip_rect] = clip
+        self._item_to_clip[label] = clip
+    
+    @classmethod
+    def _style_clip_rect(cls, clip_rect: QGraphicsRectItem, clip: TimelineClip, selected: bool):
+        """按媒体类型和选中状态设置剪辑矩形的填充和边框"""
+        media_type = clip.media_item.media_type
+        # 如果剪辑被选中，使用高亮颜色
+        if selected:
+            clip_rect.setBrush(cls._SELECTED_CLIP_BRUSHES.get(media_type, cls._SELECTED_CLIP_BRUSHES['image']))
+            clip_rect.setPen(cls._SELECTED_CLIP_PEN)
+        else:
+            clip_rect.setBrush(cls._CLIP_BRUSHES.get(media_type, cls._CLIP_BRUSHES['image']))
+            clip_rect.setPen(cls._CLIP_PEN)
+    
+    def set_selected_clips(self, clips: List[TimelineClip]):
+        """更新选中的剪辑，只重设选中状态发生变化的剪辑矩形的样式，不重建场景"""
+        previous = set(self.selected_clips)
+        self.selected_clips = clips
+        for clip in previous.symmetric_difference(clips):
+            graphics = self.clip_graphics.get(clip)
+            if graphics is not None:
+                self._style_clip_rect(graphics['rect'], clip, clip in clips)
     
     def select_all_clips(self):
         """选择所有剪辑"""
-        self.selected_clips = self.clips.copy()
-        self.redraw_timeline()
+        self.set_selected_clips(self.clips.copy())
         print(f"已选择 {len(self.selected_clips)} 个剪辑")
     
     def deselect_all_clips(self):
         """取消选择所有剪辑"""
-        self.selected_clips.clear()
-        self.redraw_timeline()
+        self.set_selected_clips([])
         print("已取消选择所有剪辑")
     
     def delete_selected_clips(self):
@@ -2321,6 +3951,8 @@ class TimelineWidget(QGraphicsView):
         for clip in self.selected_clips:
             if clip in self.clips:
                 self.clips.remove(clip)
+                self._clip_count -= 1
+        self._clip_index = None
         
         print(f"已删除 {len(self.selected_clips)} 个剪辑")
         self.selected_clips.clear()
@@ -2335,11 +3967,9 @@ class TimelineWidget(QGraphicsView):
     
     def split_clip_at_playhead(self):
         """在播放头位置分割剪辑"""
-        # 找到播放头位置的剪辑
-        clips_to_split = []
-        for clip in self.clips:
-            if clip.start_time < self.current_time < clip.end_time:
-                clips_to_split.append(clip)
+        # 找到播放头位置的剪辑（不含恰好在首尾处的剪辑）
+        clips_to_split = [clip for clip in self.clips_at(self.current_time)
+                          if clip.start_time < self.current_time < clip.end_time]
         
         if not clips_to_split:
             print("播放头位置没有剪辑可分割")
@@ -2361,11 +3991,12 @@ class TimelineWidget(QGraphicsView):
             second_part.out_point = clip.out_point
             
             # 修改原剪辑（第一部分）
-            clip.duration = split_time
-            clip.out_point = clip.in_point + split_time
+            clip.resize(split_time)
             
             # 添加第二部分到剪辑列表
             self.clips.append(second_part)
+            self._clip_count += 1
+        self._clip_index = None
         
         print(f"已在播放头位置分割 {len(clips_to_split)} 个剪辑")
         
@@ -2388,62 +4019,6 @@ class TimelineWidget(QGraphicsView):
         print(f"已剪切 {len(self.selected_clips)} 个剪辑")
         self.delete_selected_clips()
     
-    def mousePressEvent(self, event):
-        """鼠标点击事件 - 处理剪辑选择、播放位置设置和范围选择"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            # 将点击位置转换为场景坐标
-            scene_pos = self.mapToScene(event.position().toPoint())
-            
-            # 检查是否按住Shift键进行范围选择
-            if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
-                # 开始范围选择
-                self.start_range_selection(scene_pos)
-            else:
-                # 清除之前的范围选择
-                self.clear_range_selection()
-                
-                # 检查是否点击了剪辑
-                clicked_item = self.scene.itemAt(scene_pos, self.transform())
-                clicked_clip = None
-                
-                # 查找对应的剪辑对象
-                for clip, graphics in self.clip_graphics.items():
-                    if clicked_item == graphics['rect'] or clicked_item == graphics['label']:
-                        clicked_clip = clip
-                        break
-                
-                if clicked_clip:
-                    # 处理剪辑选择
-                    if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
-                        # Ctrl+点击：切换选择状态
-                        if clicked_clip in self.selected_clips:
-                            self.selected_clips.remove(clicked_clip)
-                        else:
-                            self.selected_clips.append(clicked_clip)
-                    else:
-                        # 普通点击：选择单个剪辑
-                        self.selected_clips = [clicked_clip]
-                    
-                    self.redraw_timeline()
-                    print(f"选中剪辑: {clicked_clip.media_item.name}")
-                else:
-                    # 点击空白区域：设置播放位置
-                    clicked_time = max(0, min(scene_pos.x() / self.pixels_per_second, self.timeline_duration))
-                    self.update_playhead_position(clicked_time)
-                    
-                    # 如果没有按Ctrl，取消所有选择
-                    if not (event.modifiers() & Qt.KeyboardModifier.ControlModifier):
-                        self.selected_clips.clear()
-                        self.redraw_timeline()
-                    
-                    # 通知主窗口更新播放位置
-                    main_window = self.get_main_window()
-                    if main_window and hasattr(main_window, 'video_preview'):
-                        position_ms = int(clicked_time * 1000)
-                        main_window.video_preview.media_player.setPosition(position_ms)
-        
-        super().mousePressEvent(event)
-    
     def zoom_in(self):
         """放大时间轴"""
         new_zoom = min(self.zoom_factor * 1.2, 5.0)  # 最大5倍缩放
@@ -2461,6 +4036,9 @@ class TimelineWidget(QGraphicsView):
         if (event.mimeData().hasFormat("application/x-media-item") or 
             event.mimeData().hasUrls()):
             self.is_dragging = False  # 重置状态
+            self.last_preview_pos = None
+            self._last_preview_track = None
+            self._drag_preview_duration = None
             event.acceptProposedAction()
         else:
             event.ignore()
@@ -2480,76 +4058,97 @@ class TimelineWidget(QGraphicsView):
         if (event.mimeData().hasFormat("application/x-media-item") or 
             event.mimeData().hasUrls()):
             
-            current_pos = event.position().toPoint()
+            # 计算当前位置
+            pos = self.mapToScene(event.position().toPoint())
+            y = pos.y()
             
-            # 防抖：只有位置变化超过阈值才更新预览
-            if (self.last_preview_pos is None or 
-                abs(current_pos.x() - self.last_preview_pos.x()) > 10 or
-                abs(current_pos.y() - self.last_preview_pos.y()) > 5):
-                
-                # 计算当前位置
-                pos = self.mapToScene(current_pos)
-                track = max(0, min(int(pos.y() // self.track_height), self.tracks - 1))
-                start_time = max(0, pos.x() / self.pixels_per_second)
-                
-                # 清除之前的预览
+            # 光标不在轨道区域内时不显示预览
+            if y < 0 or y >= self.tracks * self.track_height:
                 self.clear_drop_preview()
-                
-                # 获取实际媒体时长用于预览
-                duration = 5.0  # 默认时长
-                if event.mimeData().hasFormat("application/x-media-item"):
-                    try:
-                        media_index_data = event.mimeData().data("application/x-media-item")
-                        media_index = int(media_index_data.data().decode())
-                        
-                        main_window = self.get_main_window()
-                        if main_window and hasattr(main_window, 'media_library'):
-                            media_item = main_window.media_library.get_media_item(media_index)
-                            if media_item and media_item.duration > 0:
-                                duration = media_item.duration
-                    except:
-                        pass
+                self.last_preview_pos = None
+                self._last_preview_track = None
+                event.acceptProposedAction()
+                return
+            
+            track = min(int(y * self._inv_track_h), self.tracks - 1)
+            x = max(0.0, pos.x())
+            
+            # 防抖：只有换轨道或水平移动至少 2 像素才更新预览
+            if (track != self._last_preview_track or self.last_preview_pos is None or
+                    abs(x - self.last_preview_pos) >= 2):
+                if self._drag_preview_duration is None:
+                    self._drag_preview_duration = self._get_drag_media_duration(event.mimeData())
                 
                 # 显示放置预览
-                self.show_drop_preview(track, start_time, duration)
-                self.last_preview_pos = current_pos
+                self.show_drop_preview(track, x * self._inv_pps, self._drag_preview_duration)
+                self.last_preview_pos = x
+                self._last_preview_track = track
             
             event.acceptProposedAction()
         else:
             event.ignore()
     
-    def clear_drop_preview(self):
-        """清除拖拽预览"""
-        # 安全地移除所有预览项
-        for item in self.preview_items[:]:
+    def _get_drag_media_duration(self, mime_data) -> float:
+        """获取拖拽媒体的实际时长用于预览，无法获取时使用默认 5 秒"""
+        duration = 5.0  # 默认时长
+        if mime_data.hasFormat("application/x-media-item"):
             try:
-                # 检查项目是否仍在场景中
-                if item.scene() is not None and item.scene() == self.scene:
-                    self.scene.removeItem(item)
-            except Exception as e:
-                print(f"[DEBUG] 清除预览项时出错: {e}")
-        self.preview_items.clear()
+                media_index_data = mime_data.data("application/x-media-item")
+                media_index = int(media_index_data.data().decode())
+                
+                main_window = self.get_main_window()
+                if main_window and hasattr(main_window, 'media_library'):
+                    media_item = main_window.media_library.get_media_item(media_index)
+                    if media_item and media_item.duration > 0:
+                        duration = media_item.duration
+            except:
+                pass
+        return duration
+    
+    def clear_drop_preview(self):
+        """隐藏拖拽预览"""
+        if self._preview_group is not None:
+            self._preview_group.setVisible(False)
+    
+    def _detach_drop_preview(self):
+        """将预览组移出场景（对象保留以便复用）"""
+        if self._preview_group is not None and self._preview_group.scene() == self.scene:
+            self.scene.removeItem(self._preview_group)
+    
+    def _create_drop_preview_items(self):
+        """创建常驻的预览组（尚未加入场景）"""
+        self._preview_rect = QGraphicsRectItem()
+        self._preview_rect.setBrush(QBrush(QColor(100, 150, 255, 100)))  # 半透明蓝色
+        self._preview_rect.setPen(QPen(QColor(50, 100, 200), 2, Qt.PenStyle.DashLine))
+        self._preview_rect.is_preview = True  # 标记为预览项
+        
+        self._preview_text = QGraphicsTextItem()
+        self._preview_text.setFont(QFont("Arial", 8))
+        self._preview_text.setDefaultTextColor(QColor(50, 100, 200))
+        self._preview_text.is_preview = True
+        
+        self._preview_group = QGraphicsItemGroup()
+        self._preview_group.addToGroup(self._preview_rect)
+        self._preview_group.addToGroup(self._preview_text)
     
     def show_drop_preview(self, track: int, start_time: float, duration: float = 5.0):
         """显示拖拽预览"""
-        # 创建预览矩形
+        if self._preview_group is None:
+            self._create_drop_preview_items()
+        if self._preview_group.scene() != self.scene:
+            self.scene.addItem(self._preview_group)
+        
+        # 更新预览矩形
         x = start_time * self.pixels_per_second
         y = track * self.track_height
         width = duration * self.pixels_per_second  # 根据实际时长计算宽度
         height = self.track_height - 4
+        self._preview_rect.setRect(x, y + 2, width, height)
         
-        preview_rect = self.scene.addRect(x, y + 2, width, height)
-        preview_rect.setBrush(QBrush(QColor(100, 150, 255, 100)))  # 半透明蓝色
-        preview_rect.setPen(QPen(QColor(50, 100, 200), 2, Qt.PenStyle.DashLine))
-        preview_rect.is_preview = True  # 标记为预览项
-        self.preview_items.append(preview_rect)
-        
-        # 添加预览标签
-        preview_label = self.scene.addText(f"预览 ({duration:.1f}s)", QFont("Arial", 8))
-        preview_label.setPos(x + 5, y + 5)
-        preview_label.setDefaultTextColor(QColor(50, 100, 200))
-        preview_label.is_preview = True
-        self.preview_items.append(preview_label)
+        # 更新预览标签
+        self._preview_text.setPlainText(f"预览 ({duration:.1f}s)")
+        self._preview_text.setPos(x + 5, y + 5)
+        self._preview_group.setVisible(True)
     
     def dropEvent(self, event: QDropEvent):
         """处理拖拽放置事件"""
@@ -2566,8 +4165,8 @@ class TimelineWidget(QGraphicsView):
             
             # 计算放置位置
             pos = self.mapToScene(event.position().toPoint())
-            track = max(0, min(int(pos.y() // self.track_height), self.tracks - 1))
-            start_time = max(0, pos.x() / self.pixels_per_second)
+            track = max(0, min(int(pos.y() * self._inv_track_h), self.tracks - 1))
+            start_time = max(0, pos.x() * self._inv_pps)
             
             if event.mimeData().hasFormat("application/x-media-item"):
                 # 处理来自媒体库的拖拽
@@ -2589,42 +4188,26 @@ class TimelineWidget(QGraphicsView):
                     print(f"处理媒体拖拽时出错: {e}")
             
             elif event.mimeData().hasUrls():
-                # 处理文件拖拽
+                # 处理文件拖拽：一次性按扩展名划分，不为验证单独创建 MediaItem
+                file_paths = [url.toLocalFile() for url in event.mimeData().urls()
+                              if url.isLocalFile() and os.path.isfile(url.toLocalFile())]
                 valid_files = []
                 invalid_files = []
+                for path in file_paths:
+                    if is_valid_media_path(path):
+                        valid_files.append(path)
+                    else:
+                        invalid_files.append(os.path.basename(path))
                 
-                for url in event.mimeData().urls():
-                    if url.isLocalFile():
-                        file_path = url.toLocalFile()
-                        if os.path.isfile(file_path):
-                            # 验证文件类型
-                            temp_media_item = MediaItem(file_path)
-                            if temp_media_item.is_valid_media_file():
-                                valid_files.append(file_path)
-                            else:
-                                invalid_files.append(os.path.basename(file_path))
-                
-                # 添加有效文件到时间轴
-                for file_path in valid_files:
-                    media_item = MediaItem(file_path)
-                    self.add_clip(media_item, track, start_time)
-                    print(f"文件已添加到轨道 {track + 1}，时间 {start_time:.2f}s")
-                    # 只添加第一个有效文件到当前位置
-                    break
+                # 所有有效文件从放置位置起依次排列，整批只重绘一次
+                if valid_files:
+                    self.add_clips_batch([MediaItem(path) for path in valid_files], track, start_time)
+                    print(f"{len(valid_files)} 个文件已添加到轨道 {track + 1}，时间 {start_time:.2f}s")
                 
-                # 如果有无效文件，显示警告
+                # 如果有无效文件，在拖放事件返回后再显示警告，避免阻塞拖放处理
                 if invalid_files:
-                    from PyQt6.QtWidgets import QMessageBox
-                    invalid_list = "\n• ".join(invalid_files)
-                    QMessageBox.warning(
-                        self,
-                        "无法添加到时间轴",
-                        f"以下文件不是支持的媒体文件类型：\n\n• {invalid_list}\n\n"
-                        f"支持的格式：\n"
-                        f"• 视频：mp4, avi, mov, mkv, wmv, flv, m4v, webm\n"
-                        f"• 音频：mp3, wav, aac, m4a, flac, ogg\n"
-                        f"• 图片：jpg, jpeg, png, bmp, gif, tiff"
-                    )
+                    message = _UNSUPPORTED_MSG_TEMPLATE.format(invalid_list="\n• ".join(invalid_files))
+                    QTimer.singleShot(0, lambda: QMessageBox.warning(self, "无法添加到时间轴", message))
                 
                 if valid_files or invalid_files:
                     event.acceptProposedAction()
@@ -2639,14 +4222,14 @@ class TimelineWidget(QGraphicsView):
     def add_media_to_timeline(self, file_path: str, track: int):
         """添加媒体到时间轴"""
         try:
-            # 创建媒体项
-            media_item = MediaItem(file_path)
-            
-            # 检查是否为有效的媒体文件
-            if not media_item.is_valid_media_file():
+            # 先按扩展名检查，无效文件不创建 MediaItem、不读取元数据
+            if not is_valid_media_path(file_path):
                 print(f"无效的媒体文件: {file_path}")
                 return
             
+            # 创建媒体项
+            media_item = MediaItem(file_path)
+            
             # 计算开始时间（放在时间轴末尾）
             start_time = 0.0
             if self.clips:
@@ -2661,18 +4244,11 @@ class TimelineWidget(QGraphicsView):
         except Exception as e:
             print(f"添加媒体到时间轴时出错: {e}")
     
-    def get_main_window(self):
-        """获取主窗口引用"""
-        parent = self.parent()
-        while parent:
-            if isinstance(parent, QMainWindow):
-                return parent
-            parent = parent.parent()
-        return None
-    
     def set_clips(self, clips: List[TimelineClip]):
         """设置时间轴剪辑列表"""
         self.clips = clips
+        self._clip_count = len(clips)
+        self._clip_index = None
         self.selected_clips.clear()
         self.update_timeline_duration()
         self.redraw_timeline()
@@ -3155,6 +4731,43 @@ class VideoScaleController(QWidget):
         self.update()
 
 
+def _paint_scaled(painter: QPainter, pixmap: QPixmap, rect: QRect):
+    """在 rect 中居中按比例绘制 pixmap，由 painter 完成缩放，不生成缩放后的副本"""
+    scale = min(rect.width() / pixmap.width(), rect.height() / pixmap.height())
+    width = pixmap.width() * scale
+    height = pixmap.height() * scale
+    target = QRectF(rect.x() + (rect.width() - width) / 2,
+                    rect.y() + (rect.height() - height) / 2,
+                    width, height)
+    painter.drawPixmap(target, pixmap, QRectF(pixmap.rect()))
+
+
+class ScaledPixmapLabel(QLabel):
+    """按比例缩放显示图片的标签
+    
+    预览每帧都会换图，QPixmap.scaled 每次都要分配一张新图；这里只保存原图，
+    在 paintEvent 中直接缩放绘制。
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source_pixmap: Optional[QPixmap] = None
+    
+    def setPixmap(self, pixmap: QPixmap):
+        self._source_pixmap = pixmap
+        self.update()
+    
+    def paintEvent(self, event):
+        # 背景和边框仍由 QLabel 按样式表绘制
+        super().paintEvent(event)
+        if self._source_pixmap is None or self._source_pixmap.isNull():
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        _paint_scaled(painter, self._source_pixmap, self.contentsRect())
+        painter.end()
+
+
 class VideoPreviewWidget(QWidget):
     """视频预览组件"""
     
@@ -3167,6 +4780,19 @@ class VideoPreviewWidget(QWidget):
         self.timeline_widget = None  # 时间轴组件引用
         self.is_seeking = False  # 防止循环更新的标志
         
+        # 时间显示缓存：总时长文字只在时长变化时格式化，当前时间按整秒刷新
+        self._total_time_str = "00:00"
+        self._last_shown_sec = -1
+        self._last_label_text = ""  # 上次写入 time_label 的文字
+        self._play_on_load = False  # 媒体加载完成后是否自动播放，见 play_when_loaded
+        
+        # 播放时 positionChanged 只记录最新位置，由定时器按约 30fps 合并刷新界面
+        self._last_position = 0
+        self._shown_position = -1
+        self._position_timer = QTimer(self)
+        self._position_timer.setInterval(33)
+        self._position_timer.timeout.connect(self._flush_position)
+        
         # 时间轴渲染引擎
         self.timeline_renderer = TimelineRenderer()
         self.timeline_mode = False  # 是否使用时间轴渲染模式
@@ -3255,7 +4881,7 @@ class VideoPreviewWidget(QWidget):
         video_layout.addWidget(self.video_widget)
         
         # 渲染帧显示标签（用于时间轴渲染模式）
-        self.rendered_frame_label = QLabel()
+        self.rendered_frame_label = ScaledPixmapLabel()
         self.rendered_frame_label.setMinimumSize(320, 240)  # 降低最小尺寸限制
         self.rendered_frame_label.setStyleSheet("background-color: #2b2b2b; border: 1px solid #555;")
         self.rendered_frame_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -3303,7 +4929,7 @@ class VideoPreviewWidget(QWidget):
         
         # 连接信号
         self.play_btn.clicked.connect(self.toggle_playback)
-        self.media_player.positionChanged.connect(self.update_position)
+        self.media_player.positionChanged.connect(self._on_position_changed)
         self.media_player.durationChanged.connect(self.update_duration)
         self.position_slider.sliderMoved.connect(self.set_position)
         self.position_slider.sliderPressed.connect(self.on_slider_pressed)
@@ -3323,75 +4949,71 @@ class VideoPreviewWidget(QWidget):
             file_path_str = str(file_path)
         else:
             file_path_str = file_path
-            
-        self.current_media = file_path_str
         
-        # 检查文件是否存在
-        import os
-        if not os.path.exists(file_path_str):
-            print(f"[ERROR] 文件不存在 - {file_path_str}")
+        # 同一文件已加载时不再重建播放管线，调用方随后只需定位和播放
+        if (file_path_str == self.current_media and self.media_player.mediaStatus() in (
+                QMediaPlayer.MediaStatus.LoadedMedia,
+                QMediaPlayer.MediaStatus.BufferingMedia,
+                QMediaPlayer.MediaStatus.BufferedMedia)):
+            logger.debug("媒体已加载，跳过重新加载: %s", file_path_str)
             return
             
-        # 检查文件大小
-        file_size = os.path.getsize(file_path_str)
-        print(f"[DEBUG] 文件大小: {file_size / (1024*1024):.2f}MB")
+        self.current_media = file_path_str
+        self._play_on_load = False
         
-        # 检查文件扩展名
-        file_ext = os.path.splitext(file_path_str)[1].lower()
-        print(f"[DEBUG] 文件扩展名: {file_ext}")
+        # 检查文件是否存在并读取大小（一次 stat 调用）
+        try:
+            file_size = os.stat(file_path_str).st_size
+        except OSError:
+            logger.error("文件不存在 - %s", file_path_str)
+            return
+        logger.debug("文件大小: %.2fMB, 扩展名: %s",
+                     file_size / (1024 * 1024), Path(file_path_str).suffix.lower())
         
         # 设置媒体源
         media_url = QUrl.fromLocalFile(file_path_str)
-        print(f"[DEBUG] 正在加载媒体: {file_path_str}")
-        print(f"[DEBUG] 媒体URL: {media_url.toString()}")
-        print(f"[DEBUG] URL是否有效: {media_url.isValid()}")
-        print(f"[DEBUG] URL是否为本地文件: {media_url.isLocalFile()}")
+        logger.debug("正在加载媒体: %s (URL: %s)", file_path_str, media_url.toString())
         
         # 停止当前播放
-        print(f"[DEBUG] 停止当前播放，当前状态: {self.media_player.playbackState()}")
+        logger.debug("停止当前播放，当前状态: %s", self.media_player.playbackState())
         self.media_player.stop()
         
         # 设置新的媒体源
-        print(f"[DEBUG] 设置媒体源...")
         self.media_player.setSource(media_url)
         
         # 重置播放按钮状态
         self.play_btn.setText("▶")
         
-        print(f"[DEBUG] 媒体源已设置，当前播放状态: {self.media_player.playbackState()}")
-        print(f"[DEBUG] 媒体状态: {self.media_player.mediaStatus()}")
-        print(f"[DEBUG] 媒体持续时间: {self.media_player.duration()}ms")
-        print(f"[DEBUG] 视频输出对象: {self.media_player.videoOutput()}")
-        print(f"[DEBUG] 音频输出对象: {self.media_player.audioOutput()}")
-        
-        # 尝试立即播放以测试
-        print(f"[DEBUG] 尝试立即播放进行测试...")
-        self.media_player.play()
-        
-        # 等待一小段时间后检查状态
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(1000, self.check_media_load_status)
+        logger.debug("媒体源已设置，播放状态: %s, 媒体状态: %s",
+                     self.media_player.playbackState(), self.media_player.mediaStatus())
+        # 加载结果由 mediaStatusChanged 通知，见 handle_media_status_change
+    
+    def play_when_loaded(self):
+        """媒体已加载则立即播放，否则等 mediaStatusChanged 报告加载完成后再播放"""
+        if self.media_player.mediaStatus() in (
+                QMediaPlayer.MediaStatus.LoadedMedia,
+                QMediaPlayer.MediaStatus.BufferingMedia,
+                QMediaPlayer.MediaStatus.BufferedMedia):
+            self.media_player.play()
+        else:
+            self._play_on_load = True
     
     def check_media_load_status(self):
         """检查媒体加载状态"""
-        print(f"[DEBUG] === 媒体加载状态检查 ===")
-        print(f"[DEBUG] 播放状态: {self.media_player.playbackState()}")
-        print(f"[DEBUG] 媒体状态: {self.media_player.mediaStatus()}")
-        print(f"[DEBUG] 媒体持续时间: {self.media_player.duration()}ms")
-        print(f"[DEBUG] 当前位置: {self.media_player.position()}ms")
-        print(f"[DEBUG] 是否有错误: {self.media_player.error()}")
-        print(f"[DEBUG] 视频输出连接状态: {self.media_player.videoOutput() is not None}")
-        print(f"[DEBUG] 音频输出连接状态: {self.media_player.audioOutput() is not None}")
+        media_status = self.media_player.mediaStatus()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("媒体加载状态: 播放状态=%s, 媒体状态=%s, 持续时间=%sms, 当前位置=%sms, 错误=%s",
+                         self.media_player.playbackState(), media_status,
+                         self.media_player.duration(), self.media_player.position(),
+                         self.media_player.error())
         
         # 如果媒体状态是无效的，尝试其他方法
-        if self.media_player.mediaStatus() == QMediaPlayer.MediaStatus.InvalidMedia:
-            print(f"[ERROR] 媒体无效，可能是格式不支持")
-        elif self.media_player.mediaStatus() == QMediaPlayer.MediaStatus.LoadedMedia:
-            print(f"[SUCCESS] 媒体已成功加载")
-        elif self.media_player.mediaStatus() == QMediaPlayer.MediaStatus.NoMedia:
-            print(f"[ERROR] 没有媒体源")
-        
-        print(f"[DEBUG] === 状态检查结束 ===")
+        if media_status == QMediaPlayer.MediaStatus.InvalidMedia:
+            logger.error("媒体无效，可能是格式不支持")
+        elif media_status == QMediaPlayer.MediaStatus.LoadedMedia:
+            logger.info("媒体已成功加载")
+        elif media_status == QMediaPlayer.MediaStatus.NoMedia:
+            logger.error("没有媒体源")
     
     def toggle_playback(self):
         """切换播放/暂停"""
@@ -3411,24 +5033,37 @@ class VideoPreviewWidget(QWidget):
     
     def get_main_window(self):
         """获取主窗口引用"""
-        parent = self.parent()
-        while parent:
-            if isinstance(parent, QMainWindow):
-                return parent
-            parent = parent.parent()
-        return None
+        return MainWindow.instance()
+    
+    def _on_position_changed(self, position):
+        """记录播放器位置；播放中由定时器刷新，暂停时（如跳转）立即刷新"""
+        self._last_position = position
+        if not self._position_timer.isActive():
+            self._flush_position()
+    
+    def _flush_position(self):
+        """位置有变化时更新界面"""
+        if self._last_position != self._shown_position:
+            self._shown_position = self._last_position
+            self.update_position(self._last_position)
     
     def update_position(self, position):
         """更新播放位置"""
         if self.is_seeking:
             return  # 如果正在拖拽，跳过更新
-            
-        self.position_slider.setValue(position)
         
-        # 更新时间显示
-        current_time = self.format_time(position)
-        total_time = self.format_time(self.media_player.duration())
-        self.time_label.setText(f"{current_time} / {total_time}")
+        # 程序设置的进度不需要发出 valueChanged
+        with QSignalBlocker(self.position_slider):
+            self.position_slider.setValue(position)
+        
+        # 更新时间显示（显示精度为秒，同一秒内不重复格式化）
+        shown_sec = position // 1000
+        if shown_sec != self._last_shown_sec:
+            self._last_shown_sec = shown_sec
+            label_text = f"{self.format_time(position)} / {self._total_time_str}"
+            if label_text != self._last_label_text:
+                self._last_label_text = label_text
+                self.time_label.setText(label_text)
         
         # 发出位置改变信号（转换为秒）
         time_seconds = position / 1000.0
@@ -3441,6 +5076,8 @@ class VideoPreviewWidget(QWidget):
     def update_duration(self, duration):
         """更新总时长"""
         self.position_slider.setRange(0, duration)
+        self._total_time_str = self.format_time(duration)
+        self._last_shown_sec = -1  # 下次位置更新时刷新时间文字
     
     def set_position(self, position):
         """设置播放位置"""
@@ -3499,7 +5136,6 @@ class VideoPreviewWidget(QWidget):
     def handle_error(self, error, error_string):
         """处理媒体播放错误"""
         print(f"媒体播放错误: {error} - {error_string}")
-        from PyQt6.QtWidgets import QMessageBox
         QMessageBox.warning(
             self,
             "播放错误",
@@ -3513,7 +5149,14 @@ class VideoPreviewWidget(QWidget):
             QMediaPlayer.PlaybackState.PlayingState: "正在播放",
             QMediaPlayer.PlaybackState.PausedState: "已暂停"
         }
-        print(f"播放状态变化: {state_names.get(state, '未知状态')}")
+        logger.debug("播放状态变化: %s", state_names.get(state, '未知状态'))
+        
+        # 只在播放时运行位置刷新定时器，停止时补上最后一次位置
+        if state == QMediaPlayer.PlaybackState.PlayingState:
+            self._position_timer.start()
+        else:
+            self._position_timer.stop()
+            self._flush_position()
     
     def handle_media_status_change(self, status):
         """处理媒体状态变化"""
@@ -3527,10 +5170,16 @@ class VideoPreviewWidget(QWidget):
             QMediaPlayer.MediaStatus.EndOfMedia: "播放结束",
             QMediaPlayer.MediaStatus.InvalidMedia: "无效媒体"
         }
-        print(f"媒体状态变化: {status_names.get(status, '未知状态')}")
-        
-        if status == QMediaPlayer.MediaStatus.InvalidMedia:
-            from PyQt6.QtWidgets import QMessageBox
+        logger.debug("媒体状态变化: %s", status_names.get(status, '未知状态'))
+        
+        if status == QMediaPlayer.MediaStatus.LoadedMedia:
+            self.check_media_load_status()
+            if self._play_on_load:
+                self._play_on_load = False
+                self.media_player.play()
+        elif status == QMediaPlayer.MediaStatus.InvalidMedia:
+            self._play_on_load = False
+            self.check_media_load_status()
             QMessageBox.warning(
                 self,
                 "媒体错误",
@@ -3586,15 +5235,10 @@ class VideoPreviewWidget(QWidget):
                 if (target_width, target_height) != self.timeline_renderer.resolution:
                     self.timeline_renderer.set_resolution(target_width, target_height)
             
-            # 使用高质量缩放算法
-            scaled_pixmap = pixmap.scaled(
-                label_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            
-            self.rendered_frame_label.setPixmap(scaled_pixmap)
-            print(f"[DEBUG] 显示渲染帧: {pixmap.width()}x{pixmap.height()} -> {scaled_pixmap.width()}x{scaled_pixmap.height()}")
+            # 标签在绘制时按比例平滑缩放，不再为每帧生成缩放副本
+            self.rendered_frame_label.setPixmap(pixmap)
+            logger.debug("显示渲染帧: %dx%d -> %dx%d", pixmap.width(), pixmap.height(),
+                         label_size.width(), label_size.height())
     
     def handle_render_error(self, error_message: str):
         """处理渲染错误"""
@@ -3664,10 +5308,6 @@ class VideoPreviewWidget(QWidget):
         
         # 应用缩放到视频容器
         if hasattr(self, 'video_container'):
-            # 使用QGraphicsEffect实现缩放
-            from PyQt6.QtWidgets import QGraphicsEffect
-            from PyQt6.QtCore import QPropertyAnimation, QEasingCurve
-            
             # 简单的样式表缩放（备用方案）
             transform = f"scale({scale_factor})"
             self.video_container.setStyleSheet(f"QWidget {{ transform: {transform}; }}")
@@ -3708,7 +5348,6 @@ class VideoPreviewWidget(QWidget):
         )
         
         # 创建提示对话框
-        from PyQt6.QtWidgets import QMessageBox
         msg_box = QMessageBox(self)
         msg_box.setWindowTitle("变换模式已激活")
         msg_box.setText(tips_text)
@@ -3813,8 +5452,17 @@ class VideoPreviewWidget(QWidget):
 class MainWindow(QMainWindow):
     """主窗口"""
     
+    # 当前主窗口的弱引用，子组件通过 MainWindow.instance() 获取，无需遍历父对象链
+    _instance: Optional[weakref.ref] = None
+    
+    @classmethod
+    def instance(cls) -> Optional["MainWindow"]:
+        """返回当前主窗口，尚未创建或已销毁时返回 None"""
+        return cls._instance() if cls._instance is not None else None
+    
     def __init__(self):
         super().__init__()
+        MainWindow._instance = weakref.ref(self)
         self.setWindowTitle("EzCut - 专业视频编辑器")
         self.setGeometry(100, 100, 1400, 900)
         
@@ -3824,6 +5472,21 @@ class MainWindow(QMainWindow):
         self.current_project_file = None
         self.project_modified = False
         
+        # 导出对话框只创建一次，避免每次导出都重新初始化原生对话框
+        self._export_dialog = QFileDialog(self)
+        self._export_dialog.setNameFilters(["MP4文件 (*.mp4)", "AVI文件 (*.avi)", "所有文件 (*)"])
+        self._export_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+        self._export_dialog.setDefaultSuffix("mp4")
+        self._segment_exporter = None
+        
+        # 跳转合并：上一次 setPosition 完成前，新的跳转只记录最新目标
+        self._is_seeking = False
+        self._seek_pending: Optional[int] = None
+        self._seek_guard_timer = QTimer(self)
+        self._seek_guard_timer.setSingleShot(True)
+        self._seek_guard_timer.setInterval(300)  # 播放器未回报位置时的兜底
+        self._seek_guard_timer.timeout.connect(self.on_player_seeked)
+        
         self.setup_ui()
         self.setup_menus()
         self.setup_toolbar()
@@ -3902,6 +5565,9 @@ class MainWindow(QMainWindow):
         # 连接视频预览器的播放状态变化信号到工具栏更新
         self.video_preview.media_player.playbackStateChanged.connect(self.update_toolbar_play_button)
         
+        # 播放器位置更新作为跳转完成的通知
+        self.video_preview.media_player.positionChanged.connect(self.on_player_seeked)
+        
         # 连接时间轴信号到预览器
         self.timeline.clips_changed.connect(self.on_timeline_clips_changed)
         self.timeline.playhead_position_changed.connect(self.on_playhead_position_changed)
@@ -4174,18 +5840,21 @@ class MainWindow(QMainWindow):
         self.resolution_label = QLabel("分辨率: 1920x1080")
         statusbar.addPermanentWidget(self.resolution_label)
     
+    def get_export_path(self, title: str, default_name: str = "") -> str:
+        """通过复用的导出对话框选择保存路径，取消时返回空字符串"""
+        self._export_dialog.setWindowTitle(title)
+        self._export_dialog.selectFile(default_name)
+        if self._export_dialog.exec():
+            return self._export_dialog.selectedFiles()[0]
+        return ""
+    
     def export_video(self):
         """导出视频"""
-        if not self.timeline.clips:
+        if self.timeline._clip_count == 0:
             QMessageBox.warning(self, "警告", "时间轴上没有剪辑，无法导出")
             return
         
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "导出视频",
-            "",
-            "MP4文件 (*.mp4);;AVI文件 (*.avi);;所有文件 (*)"
-        )
+        file_path = self.get_export_path("导出视频")
         
         if file_path:
             # 这里应该实现实际的视频导出逻辑
@@ -4286,7 +5955,7 @@ class MainWindow(QMainWindow):
         print(f"[DEBUG] 智能播放处理器启动")
         
         # 优先级1: 检查时间轴上是否有剪辑
-        if self.timeline.clips:
+        if self.timeline._clip_count > 0:
             print(f"[DEBUG] 时间轴上有剪辑，尝试播放")
             self.play_timeline_at_current_position()
             return
@@ -4297,8 +5966,8 @@ class MainWindow(QMainWindow):
             first_media = self.media_library.media_items[0]
             self.video_preview.load_media(first_media.file_path)
             
-            # 延迟播放，等待媒体加载完成
-            QTimer.singleShot(500, lambda: self.start_playback_after_load())
+            # 媒体加载完成后开始播放，工具栏按钮随播放状态信号更新
+            self.video_preview.play_when_loaded()
             return
         
         # 优先级3: 没有任何媒体，提示用户导入
@@ -4314,77 +5983,83 @@ class MainWindow(QMainWindow):
             # 自动打开导入对话框
             self.media_library.import_media()
     
-    def start_playback_after_load(self):
-        """媒体加载后开始播放"""
-        if self.video_preview.current_media:
-            self.video_preview.media_player.play()
-            self.play_action.setText("⏸")
-            self.play_action.setToolTip("暂停")
-            print(f"[DEBUG] 自动播放已开始")
-    
     def play_timeline_at_current_position(self):
         """在当前时间轴位置播放剪辑"""
         current_time = self.timeline.get_current_time()
-        print(f"[DEBUG] 尝试播放时间轴位置: {current_time:.2f}s")
-        print(f"[DEBUG] 时间轴上的剪辑数量: {len(self.timeline.clips)}")
+        logger.debug("尝试播放时间轴位置: %.2fs, 剪辑数量: %d", current_time, self.timeline._clip_count)
         
         # 查找当前时间位置的剪辑
-        active_clip = None
-        for i, clip in enumerate(self.timeline.clips):
-            clip_start = clip.start_time
-            clip_end = clip.start_time + clip.duration
-            print(f"[DEBUG] 剪辑 {i}: {clip.media_item.name}, 时间范围: {clip_start:.2f}s - {clip_end:.2f}s")
-            
-            if clip_start <= current_time <= clip_end:
-                active_clip = clip
-                print(f"[DEBUG] 找到活动剪辑: {clip.media_item.name}")
-                break
+        active_clips = self.timeline.clips_at(current_time)
+        active_clip = active_clips[0] if active_clips else None
         
         if active_clip:
-            print(f"[DEBUG] 加载媒体文件: {active_clip.media_item.file_path}")
+            logger.debug("找到活动剪辑: %s", active_clip.media_item.file_path)
             # 加载并播放找到的剪辑
             self.video_preview.load_media(active_clip.media_item.file_path)
             
             # 设置播放位置到剪辑内的相对时间
             relative_time = current_time - active_clip.start_time
             position_ms = int(relative_time * 1000)
-            print(f"[DEBUG] 设置播放位置: {relative_time:.2f}s ({position_ms}ms)")
-            self.video_preview.media_player.setPosition(position_ms)
+            self.set_player_position(position_ms)
             
             # 开始播放
-            print(f"[DEBUG] 开始播放")
             self.video_preview.media_player.play()
             self.play_action.setText("⏸")
             self.play_action.setToolTip("暂停")
             
-            print(f"播放剪辑: {active_clip.media_item.name}，从 {relative_time:.2f}s 开始")
+            logger.info("播放剪辑: %s，从 %.2fs 开始", active_clip.media_item.name, relative_time)
         else:
-            print(f"[DEBUG] 在时间轴位置 {current_time:.2f}s 处没有找到剪辑")
+            logger.debug("在时间轴位置 %.2fs 处没有找到剪辑", current_time)
             # 如果时间轴上有剪辑但当前位置没有，尝试播放第一个剪辑
-            if self.timeline.clips:
+            if self.timeline._clip_count > 0:
                 first_clip = self.timeline.clips[0]
-                print(f"[DEBUG] 播放第一个剪辑: {first_clip.media_item.name}")
+                logger.debug("播放第一个剪辑: %s", first_clip.media_item.name)
                 self.video_preview.load_media(first_clip.media_item.file_path)
-                self.video_preview.media_player.setPosition(0)
+                self.set_player_position(0)
                 self.video_preview.media_player.play()
                 self.play_action.setText("⏸")
                 self.play_action.setToolTip("暂停")
                 # 更新播放头到第一个剪辑的开始位置
                 self.timeline.update_playhead_position(first_clip.start_time)
     
+    def set_player_position(self, position_ms: int):
+        """跳转播放器位置，上一次跳转未完成时只保留最新的请求"""
+        if self._is_seeking:
+            self._seek_pending = position_ms
+            return
+        
+        self._is_seeking = True
+        self._seek_guard_timer.start()
+        self.video_preview.media_player.setPosition(position_ms)
+    
+    def on_player_seeked(self, *args):
+        """播放器回报位置即认为跳转完成，继续执行挂起的跳转"""
+        if not self._is_seeking:
+            return
+        
+        self._is_seeking = False
+        self._seek_guard_timer.stop()
+        if self._seek_pending is not None:
+            position_ms = self._seek_pending
+            self._seek_pending = None
+            self.set_player_position(position_ms)
+    
     def update_toolbar_play_button(self, state):
         """根据播放状态更新工具栏播放按钮"""
         if state == QMediaPlayer.PlaybackState.PlayingState:
-            self.play_action.setText("⏸")
-            self.play_action.setToolTip("暂停")
+            # 播放状态信号可能重复到达，文字未变时不再更新按钮
+            if self.play_action.text() != "⏸":
+                self.play_action.setText("⏸")
+                self.play_action.setToolTip("暂停")
             # 同步更新视频预览器的播放按钮
-            self.video_preview.play_btn.setText("⏸")
+            if self.video_preview.play_btn.text() != "⏸":
+                self.video_preview.play_btn.setText("⏸")
     
     def on_timeline_clips_changed(self):
         """时间轴剪辑变化时的处理"""
-        print(f"[DEBUG] 时间轴剪辑发生变化，剪辑数量: {len(self.timeline.clips)}")
+        print(f"[DEBUG] 时间轴剪辑发生变化，剪辑数量: {self.timeline._clip_count}")
         
-        if self.timeline.clips:
+        if self.timeline._clip_count > 0:
             # 有剪辑时启用时间轴预览模式
             print(f"[DEBUG] 启用时间轴预览模式")
             self.video_preview.enable_timeline_preview(self.timeline.clips)
@@ -4398,9 +6073,10 @@ class MainWindow(QMainWindow):
     
     def on_playhead_position_changed(self, position):
         """播放头位置变化时的处理"""
-        if self.video_preview.timeline_mode:
-            # 在时间轴模式下，跳转到对应位置
-            self.video_preview.seek_timeline_position(position)
+        # 拖动播放头时由时间轴按节流间隔同步预览，这里不再逐次跳转
+        if self.video_preview.timeline_mode and not self.timeline.is_dragging_playhead():
+            # 在时间轴模式下，跳转到对应位置；时间轴点击时已经同步过的位置不会重复跳转
+            self.timeline.sync_video_preview(position)
     
     def export_selected_segment(self):
         """导出选中的时间片段"""
@@ -4426,11 +6102,9 @@ class MainWindow(QMainWindow):
         
         if result == QMessageBox.StandardButton.Yes:
             # 选择保存文件
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
+            file_path = self.get_export_path(
                 "导出视频片段",
-                f"segment_{self.format_time(start_time).replace(':', '-')}_to_{self.format_time(end_time).replace(':', '-')}.mp4",
-                "MP4文件 (*.mp4);;AVI文件 (*.avi);;所有文件 (*)"
+                f"segment_{self.format_time(start_time).replace(':', '-')}_to_{self.format_time(end_time).replace(':', '-')}.mp4"
             )
             
             if file_path:
@@ -4462,32 +6136,66 @@ class MainWindow(QMainWindow):
     
     def export_video_segment(self, start_time, end_time):
         """导出视频片段"""
-        duration = end_time - start_time
-        
         # 选择保存文件
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
+        file_path = self.get_export_path(
             "导出视频片段",
-            f"segment_{self.format_time(start_time).replace(':', '-')}_to_{self.format_time(end_time).replace(':', '-')}.mp4",
-            "MP4文件 (*.mp4);;AVI文件 (*.avi);;所有文件 (*)"
+            f"segment_{self.format_time(start_time).replace(':', '-')}_to_{self.format_time(end_time).replace(':', '-')}.mp4"
         )
         
         if file_path:
-            # 这里应该实现实际的视频片段导出逻辑
-            info_msg = f"片段导出信息:\n"
-            info_msg += f"起始时间: {self.format_time(start_time)}\n"
-            info_msg += f"结束时间: {self.format_time(end_time)}\n"
-            info_msg += f"片段时长: {self.format_time(duration)}\n"
-            info_msg += f"导出路径: {file_path}"
-            
-            QMessageBox.information(self, "导出完成", info_msg)
-            print(f"[INFO] 视频片段导出完成: {file_path}")
+            if not AV_AVAILABLE:
+                QMessageBox.warning(self, "导出失败", "PyAV 未安装，无法导出视频片段。\n请安装: pip install av")
+                return
+            
+            video_clips = [clip for clip in self.timeline.clips
+                           if clip.media_item.media_type == 'video'
+                           and clip.end_time > start_time and clip.start_time < end_time]
+            if not video_clips:
+                QMessageBox.warning(self, "导出失败", "所选区间内没有视频剪辑")
+                return
+            
+            # 以第一个视频剪辑的分辨率和帧率作为输出参数
+            first_media = video_clips[0].media_item
+            resolution = (first_media.width, first_media.height) if first_media.width and first_media.height else (1280, 720)
+            fps = first_media.fps or 30.0
+            
+            self._segment_exporter = SegmentExporter(self.timeline.clips, start_time, end_time,
+                                                     file_path, resolution, fps)
+            self._segment_exporter.start()
+            self.statusBar().showMessage(f"正在导出视频片段: {os.path.basename(file_path)}")
+            print(f"[INFO] 开始导出视频片段: {file_path}")
+            QTimer.singleShot(200, lambda: self.check_segment_export(start_time, end_time))
         else:
             self.play_action.setText("▶")
             self.play_action.setToolTip("播放")
             # 同步更新视频预览器的播放按钮
             self.video_preview.play_btn.setText("▶")
     
+    def check_segment_export(self, start_time, end_time):
+        """轮询片段导出流水线状态"""
+        exporter = self._segment_exporter
+        if exporter.is_running():
+            QTimer.singleShot(200, lambda: self.check_segment_export(start_time, end_time))
+            return
+        
+        self._segment_exporter = None
+        if exporter.error:
+            self.statusBar().showMessage("视频片段导出失败")
+            QMessageBox.critical(self, "导出失败", exporter.error)
+            print(f"[ERROR] 视频片段导出失败: {exporter.error}")
+            return
+        
+        info_msg = f"片段导出信息:\n"
+        info_msg += f"起始时间: {self.format_time(start_time)}\n"
+        info_msg += f"结束时间: {self.format_time(end_time)}\n"
+        info_msg += f"片段时长: {self.format_time(end_time - start_time)}\n"
+        info_msg += f"导出帧数: {exporter.frames_written}\n"
+        info_msg += f"导出路径: {exporter.output_path}"
+        
+        self.statusBar().showMessage("视频片段导出完成")
+        QMessageBox.information(self, "导出完成", info_msg)
+        print(f"[INFO] 视频片段导出完成: {exporter.output_path}")
+    
     def new_project(self):
         """新建项目"""
         if self.project_modified:
@@ -4743,17 +6451,13 @@ class MainWindow(QMainWindow):
     
     def show_about(self):
         """显示关于对话框"""
-        QMessageBox.about(
-            self,
-            "关于 EzCut",
-            "EzCut - 专业视频编辑器\n\n"
-            "基于 PyQt6 开发的现代化视频编辑软件\n"
-            "支持多轨道编辑、实时预览、丰富的效果等功能\n\n"
-            "版本: 1.0.0"
-        )
+        QMessageBox.about(self, "关于 EzCut", _ABOUT_TEXT)
 
 def main():
     """主函数"""
+    # 调试输出默认关闭，需要时将级别改为 logging.DEBUG
+    logging.basicConfig(level=logging.WARNING, format="[%(levelname)s] %(message)s")
+    
     app = QApplication(sys.argv)
     
     # 设置应用信息
@@ -4764,6 +6468,9 @@ def main():
     # 设置应用样式
     app.setStyle("Fusion")
     
+    # Qt 绘制样式和缩放图标时使用 QPixmapCache，默认 10 MB 对大媒体库偏小
+    QPixmapCache.setCacheLimit(64 * 1024)
+    
     # 创建主窗口
     window = MainWindow()
     window.show()